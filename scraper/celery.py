@@ -1,6 +1,7 @@
-from __future__ import absolute_import, unicode_literals
 import os
+from importlib import import_module
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'scraper.settings')
 
@@ -10,6 +11,25 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 
 app.autodiscover_tasks(['scraper'])
 
+WARM_IMPORTS = ('scraper.tasks', 'scraper.runtime', 'scraper.services.scraper_service')
+
+
+@worker_init.connect
+def warm_imports(**kwargs):
+    import django
+
+    django.setup()
+    for module in WARM_IMPORTS:
+        import_module(module)
+
+
+@worker_process_shutdown.connect
+def close_runtime(**kwargs):
+    from scraper.runtime import shutdown
+
+    shutdown()
+
+
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from importlib import import_module
+from typing import Any, Dict, List
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+MODES = ('lazy', 'warm')
+
+
+def probe(mode: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    from scraper.celery import WARM_IMPORTS, warm_imports
+    if mode == 'warm':
+        warm_imports()
+    else:
+        # Bez rozgrzewki worker tylko konfiguruje Django, a moduły scrapera importuje dopiero pierwsze zadanie.
+        import django
+
+        django.setup()
+    boot = time.perf_counter() - start
+    boot_rss = rss_mb()
+
+    start = time.perf_counter()
+    for module in WARM_IMPORTS:
+        import_module(module)
+    first_task = time.perf_counter() - start
+
+    return {
+        'boot_ms': boot * 1000,
+        'first_task_import_ms': first_task * 1000,
+        'ready_ms': (boot + first_task) * 1000,
+        'boot_rss_mb': boot_rss,
+        'rss_mb': rss_mb(),
+        'modules': len(sys.modules),
+        'rest_framework': 'rest_framework' in sys.modules,
+    }
+
+
+def measure(settings_module: str, mode: str, runs: int) -> Dict[str, Any]:
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    samples: List[Dict[str, Any]] = []
+    for _ in range(runs):
+        # Każda próba to nowy proces, więc żaden moduł nie jest zaimportowany z góry.
+        output = subprocess.run(
+            [sys.executable, '-m', 'scraper.measure_startup', '--probe', mode],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    result: Dict[str, Any] = {'settings': settings_module, 'mode': mode, 'runs': runs}
+    for key in ('boot_ms', 'first_task_import_ms', 'ready_ms', 'boot_rss_mb', 'rss_mb', 'modules'):
+        result[key] = round(statistics.median(sample[key] for sample in samples), 1)
+    result['rest_framework'] = any(sample['rest_framework'] for sample in samples)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mierzy czas zimnego startu i RSS workera scrapera.")
+    parser.add_argument('--probe', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--settings', nargs='+', default=[os.getenv('DJANGO_SETTINGS_MODULE', 'scraper.settings')])
+    args = parser.parse_args()
+
+    if args.probe:
+        print(json.dumps(probe(args.probe)))
+        return
+
+    for settings_module in args.settings:
+        for mode in args.modes:
+            print(json.dumps(measure(settings_module, mode, args.runs)))
+
+
+if __name__ == '__main__':
+    main()
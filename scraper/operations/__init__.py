@@ -1,3 +1,19 @@
+from scraper.operations.download_queue import DownloadQueue, HostLimiter
+from scraper.operations.html_document import HtmlDocument, get_html_parser
+from scraper.operations.retry_policy import CircuitBreaker, CircuitBreakerRegistry, FetchError, RetryPolicy
 from scraper.operations.requests_scraper import RequestsScraper
+from scraper.operations.page_fetcher import PageFetcher, TokenBucket
 
-__all__ = ['RequestsScraper']
\ No newline at end of file
+__all__ = [
+    'RequestsScraper',
+    'PageFetcher',
+    'TokenBucket',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'CircuitBreakerRegistry',
+    'FetchError',
+    'HtmlDocument',
+    'get_html_parser',
+    'DownloadQueue',
+    'HostLimiter',
+]
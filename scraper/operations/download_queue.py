@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, Union
+from urllib.parse import urlsplit
+
+
+class HostLimiter:
+    def __init__(self, per_host: int = 2) -> None:
+        self.per_host = max(1, per_host)
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def for_url(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        if host not in self.semaphores:
+            self.semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self.semaphores[host]
+
+
+class DownloadQueue:
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        url_for_job: Callable[[Any], str],
+        concurrency: int = 8,
+        per_host: int = 2,
+        maxsize: int = 100
+    ) -> None:
+        self.handler = handler
+        self.url_for_job = url_for_job
+        self.concurrency = max(1, concurrency)
+        self.limiter = HostLimiter(per_host)
+        self.maxsize = max(1, maxsize)
+        self.completed = 0
+        self.failed = 0
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                if job is None:
+                    return
+                async with self.limiter.for_url(self.url_for_job(job)):
+                    await self.handler(job)
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"Błąd przetwarzania zadania {job!r}: {e!r}")
+            finally:
+                queue.task_done()
+
+    async def run(self, jobs: Union[Iterable[Any], AsyncIterable[Any]]) -> None:
+        # Ograniczona kolejka wstrzymuje producenta, zamiast trzymać w pamięci całą listę zadań.
+        queue: asyncio.Queue = asyncio.Queue(self.maxsize)
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)]
+
+        try:
+            if hasattr(jobs, '__aiter__'):
+                async for job in jobs:
+                    await queue.put(job)
+            else:
+                for job in jobs:
+                    await queue.put(job)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
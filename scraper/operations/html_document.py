@@ -0,0 +1,153 @@
+import importlib.util
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Type, Union
+
+SKIPPED_TAGS = ('script', 'style', 'noscript', 'template')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+class HtmlParserBackend:
+    name = ''
+    module = ''
+
+    @classmethod
+    def available(cls) -> bool:
+        return not cls.module or importlib.util.find_spec(cls.module) is not None
+
+    def parse(self, html: str) -> Any:
+        raise NotImplementedError
+
+    def text(self, document: Any) -> str:
+        raise NotImplementedError
+
+
+class SelectolaxParserBackend(HtmlParserBackend):
+    name = 'selectolax'
+    module = 'selectolax'
+
+    def parse(self, html: str) -> Any:
+        from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+
+        return SelectolaxHTMLParser(html)
+
+    def text(self, document: Any) -> str:
+        document.strip_tags(list(SKIPPED_TAGS))
+        root = document.body or document.root
+        return normalize_text(root.text(separator=' ')) if root is not None else ''
+
+
+class LxmlParserBackend(HtmlParserBackend):
+    name = 'lxml'
+    module = 'lxml'
+
+    def parse(self, html: str) -> Any:
+        import lxml.html
+
+        return lxml.html.document_fromstring(html) if html.strip() else None
+
+    def text(self, document: Any) -> str:
+        if document is None:
+            return ''
+        for element in document.xpath('|'.join(f'//{tag}' for tag in SKIPPED_TAGS)):
+            element.drop_tree()
+        return normalize_text(document.text_content())
+
+
+class TextCollector(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.skipped_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: Any) -> None:
+        if tag in SKIPPED_TAGS:
+            self.skipped_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS and self.skipped_depth:
+            self.skipped_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self.skipped_depth:
+            self.parts.append(data)
+
+
+class StdlibParserBackend(HtmlParserBackend):
+    name = 'html.parser'
+
+    def parse(self, html: str) -> TextCollector:
+        collector = TextCollector()
+        collector.feed(html)
+        collector.close()
+        return collector
+
+    def text(self, document: TextCollector) -> str:
+        return normalize_text(' '.join(document.parts))
+
+
+HTML_PARSER_BACKENDS: Dict[str, Type[HtmlParserBackend]] = {
+    SelectolaxParserBackend.name: SelectolaxParserBackend,
+    LxmlParserBackend.name: LxmlParserBackend,
+    StdlibParserBackend.name: StdlibParserBackend,
+}
+
+
+def get_html_parser(name: Optional[str] = None) -> HtmlParserBackend:
+    if name:
+        backend = HTML_PARSER_BACKENDS[name]
+        if not backend.available():
+            raise ImportError(f"Parser HTML '{name}' nie jest zainstalowany")
+        return backend()
+
+    for backend in HTML_PARSER_BACKENDS.values():
+        if backend.available():
+            return backend()
+    return StdlibParserBackend()
+
+
+class HtmlDocument:
+    def __init__(
+        self,
+        content: Union[str, bytes],
+        encoding: str = 'utf-8',
+        parser: Optional[str] = None,
+        url: Optional[str] = None
+    ) -> None:
+        self.content = content
+        self.encoding = encoding
+        self.parser_name = parser
+        self.url = url
+        self._text: Optional[str] = None
+        self._backend: Optional[HtmlParserBackend] = None
+        self._parsed: Any = None
+        self._text_content: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            content = self.content
+            self._text = content.decode(self.encoding, errors='replace') if isinstance(content, bytes) else content
+        return self._text
+
+    @property
+    def backend(self) -> HtmlParserBackend:
+        if self._backend is None:
+            self._backend = get_html_parser(self.parser_name)
+        return self._backend
+
+    @property
+    def parsed(self) -> Any:
+        if self._parsed is None:
+            self._parsed = self.backend.parse(self.text)
+        return self._parsed
+
+    def text_content(self) -> str:
+        # Ekstrakcja usuwa z drzewa skrypty i style, więc pracuje na osobnej kopii dokumentu.
+        if self._text_content is None:
+            self._text_content = self.backend.text(self.backend.parse(self.text))
+        return self._text_content
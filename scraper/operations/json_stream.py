@@ -0,0 +1,77 @@
+import json
+from typing import Any, List
+
+WHITESPACE = ' \t\n\r'
+NUMBER_START = '-0123456789'
+VALUE_DELIMITERS = WHITESPACE + ',]'
+
+
+class JSONArrayStreamDecoder:
+    def __init__(self) -> None:
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.state = 'start'
+
+    def _skip_whitespace(self) -> None:
+        while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+            self.position += 1
+
+    def _decode(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+
+        while True:
+            self._skip_whitespace()
+            if self.position >= len(self.buffer):
+                break
+
+            char = self.buffer[self.position]
+
+            if self.state == 'start':
+                if char != '[':
+                    raise ValueError("Oczekiwano tablicy JSON")
+                self.position += 1
+                self.state = 'value_or_end'
+            elif self.state in ('value_or_end', 'value'):
+                if char == ']' and self.state == 'value_or_end':
+                    self.position += 1
+                    self.state = 'done'
+                    continue
+                try:
+                    item, end = self.decoder.raw_decode(self.buffer, self.position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # Liczba ("12" z "12.5", "1" z "1e3") jest kompletna dopiero po separatorze albo na końcu danych.
+                if not final and char in NUMBER_START and (
+                    end == len(self.buffer) or self.buffer[end] not in VALUE_DELIMITERS
+                ):
+                    break
+                items.append(item)
+                self.position = end
+                self.state = 'comma_or_end'
+            elif self.state == 'comma_or_end':
+                if char == ',':
+                    self.state = 'value'
+                elif char == ']':
+                    self.state = 'done'
+                else:
+                    raise ValueError(f"Nieoczekiwany znak {char!r} w tablicy JSON")
+                self.position += 1
+            else:
+                raise ValueError("Dane po zakończeniu tablicy JSON")
+
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+        return items
+
+    def feed(self, chunk: str) -> List[Any]:
+        self.buffer += chunk
+        return self._decode(final=False)
+
+    def close(self) -> List[Any]:
+        items = self._decode(final=True)
+        if self.state != 'done':
+            raise ValueError("Niekompletna tablica JSON")
+        return items
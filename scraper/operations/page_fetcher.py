@@ -0,0 +1,139 @@
+import asyncio
+import time
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from scraper.operations.requests_scraper import RequestsScraper
+from scraper.operations.retry_policy import FetchError
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class PageFetcher:
+    def __init__(
+        self,
+        scraper: RequestsScraper,
+        url_for_page: Callable[[int], Awaitable[str]],
+        concurrency: int = 4,
+        requests_per_second: float = 2.0,
+        ordered: bool = True,
+        max_pages: int = 10000,
+        first_page: int = 1
+    ) -> None:
+        self.scraper = scraper
+        self.url_for_page = url_for_page
+        self.concurrency = max(1, concurrency)
+        self.bucket = TokenBucket(requests_per_second)
+        self.ordered = ordered
+        self.first_page = first_page
+        self.stop_page = first_page + max_pages
+        self.errors: Dict[int, FetchError] = {}
+        self.truncated = False
+
+    @property
+    def failed_pages(self) -> Dict[int, FetchError]:
+        return {page: error for page, error in self.errors.items() if page < self.stop_page}
+
+    def stop_after(self, page_number: int) -> None:
+        self.stop_page = min(self.stop_page, page_number + 1)
+
+    async def _fetch_page(self, page_number: int) -> Union[List[Dict[str, Any]], FetchError]:
+        url = await self.url_for_page(page_number)
+        await self.bucket.acquire()
+        return await self.scraper.fetch_json(url)
+
+    async def pages(self) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        in_flight: Dict[asyncio.Task, int] = {}
+        buffered: Dict[int, List[Dict[str, Any]]] = {}
+        next_page = self.first_page
+        next_to_yield = self.first_page
+
+        try:
+            while True:
+                while len(in_flight) < self.concurrency and next_page < self.stop_page:
+                    task = asyncio.create_task(self._fetch_page(next_page))
+                    in_flight[task] = next_page
+                    next_page += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    page_number = in_flight.pop(task)
+                    data = task.result()
+                    if isinstance(data, FetchError):
+                        self.errors[page_number] = data
+                        if data.reason == FetchError.CIRCUIT_OPEN:
+                            self.truncated = True
+                            self.stop_page = min(self.stop_page, page_number)
+                    elif not data:
+                        self.stop_page = min(self.stop_page, page_number)
+                    elif page_number < self.stop_page:
+                        buffered[page_number] = data
+
+                for task, page_number in list(in_flight.items()):
+                    if page_number >= self.stop_page:
+                        task.cancel()
+                        del in_flight[task]
+
+                if self.ordered:
+                    while next_to_yield < self.stop_page and (next_to_yield in buffered or next_to_yield in self.errors):
+                        if next_to_yield in buffered:
+                            yield next_to_yield, buffered.pop(next_to_yield)
+                        next_to_yield += 1
+                else:
+                    for page_number in sorted(buffered):
+                        if page_number < self.stop_page:
+                            yield page_number, buffered[page_number]
+                    buffered.clear()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def stream_items(self) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        page_number = self.first_page
+
+        while page_number < self.stop_page:
+            url = await self.url_for_page(page_number)
+            await self.bucket.acquire()
+
+            received = 0
+            async with aclosing(self.scraper.stream_json_array(url)) as items:
+                async for item in items:
+                    if isinstance(item, FetchError):
+                        self.errors[page_number] = item
+                        if item.reason == FetchError.CIRCUIT_OPEN:
+                            self.truncated = True
+                            self.stop_page = min(self.stop_page, page_number)
+                        break
+                    received += 1
+                    yield page_number, item
+
+            if received == 0 and page_number not in self.errors:
+                self.stop_page = min(self.stop_page, page_number)
+            page_number += 1
@@ -1,70 +1,215 @@
+import codecs
 import httpx
-from bs4 import BeautifulSoup
-from typing import Optional, Any, Dict, Union
+import importlib.util
+import os
+from typing import Optional, Any, AsyncIterator, Dict, Union
 import asyncio
+from scraper.operations.html_document import HtmlDocument
+from scraper.operations.json_stream import JSONArrayStreamDecoder
+from scraper.operations.retry_policy import CircuitBreakerRegistry, FetchError, RetryPolicy
 
 class RequestsScraper:
-    def __init__(self, timeout: int = 60000) -> None:
+    DEFAULT_TIMEOUT = 60000
+    DEFAULT_MAX_CONNECTIONS = 20
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+    DEFAULT_KEEPALIVE_EXPIRY = 30.0
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    _shared_client: Optional[httpx.AsyncClient] = None
+    _shared_pid: Optional[int] = None
+
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None
+    ) -> None:
         self.timeout = timeout / 1000
-        self.client = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breakers = breakers or CircuitBreakerRegistry()
+        self.client = client
+        self.owns_client = client is None
+        self.client_options: Dict[str, Any] = {
+            'timeout': timeout,
+            'http2': http2,
+            'max_connections': max_connections,
+            'max_keepalive_connections': max_keepalive_connections,
+            'keepalive_expiry': keepalive_expiry,
+            'transport': transport,
+        }
+
+    @staticmethod
+    def build_client(
+        timeout: int = DEFAULT_TIMEOUT,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> httpx.AsyncClient:
+        options: Dict[str, Any] = {
+            'timeout': timeout / 1000,
+            'follow_redirects': True,
+        }
+
+        if transport is not None:
+            options['transport'] = transport
+        else:
+            options.update(
+                verify=False,
+                http2=http2 and importlib.util.find_spec('h2') is not None,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry
+                )
+            )
+
+        return httpx.AsyncClient(**options)
+
+    @classmethod
+    def shared_client(cls, **options: Any) -> httpx.AsyncClient:
+        if cls._shared_pid != os.getpid() or cls._shared_client is None or cls._shared_client.is_closed:
+            cls._shared_client = cls.build_client(**options)
+            cls._shared_pid = os.getpid()
+        return cls._shared_client
+
+    @classmethod
+    async def close_shared_client(cls) -> None:
+        if cls._shared_pid == os.getpid() and cls._shared_client is not None:
+            await cls._shared_client.aclose()
+        cls._shared_client = None
+        cls._shared_pid = None
 
     async def __aenter__(self) -> 'RequestsScraper':
-        self.client = httpx.AsyncClient(
-            timeout=self.timeout,
-            follow_redirects=True,
-            verify=False
-        )
+        if self.client is None:
+            self.client = self.build_client(**self.client_options)
         return self
 
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-        if self.client:
+        if self.client and self.owns_client:
             await self.client.aclose()
 
-    async def fetch_html(self, url: str, agent: str, retries: int = 3) -> Optional[str]:
+    async def request(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        retries: Optional[int] = None,
+        stream: bool = False
+    ) -> Union[httpx.Response, FetchError]:
         if not self.client:
-            return None
+            return FetchError(url, FetchError.FATAL)
+
+        attempts = retries if retries is not None else self.retry_policy.max_attempts
+        breaker = self.breakers.for_url(url)
+        error = FetchError(url, FetchError.RETRIES_EXHAUSTED)
+
+        for attempt in range(attempts):
+            if not breaker.allow():
+                return FetchError(url, FetchError.CIRCUIT_OPEN, error.status_code, error.exception)
+            probe = breaker.half_open
+
+            response = None
+            try:
+                response = await self.client.send(self.client.build_request('GET', url, headers=headers), stream=stream)
+            except Exception as e:
+                if not self.retry_policy.is_retryable_exception(e):
+                    if probe:
+                        breaker.release()
+                    return FetchError(url, FetchError.FATAL, exception=e)
+                error = FetchError(url, FetchError.RETRIES_EXHAUSTED, exception=e)
+            else:
+                if response.is_success:
+                    breaker.record_success()
+                    return response
+                if stream:
+                    await response.aclose()
+                if not self.retry_policy.is_retryable_status(response.status_code):
+                    breaker.record_success()
+                    return FetchError(url, FetchError.FATAL, status_code=response.status_code)
+                error = FetchError(url, FetchError.RETRIES_EXHAUSTED, status_code=response.status_code)
+
+            breaker.record_failure()
+            if attempt < attempts - 1:
+                await asyncio.sleep(self.retry_policy.delay(attempt, response))
 
+        return error
+
+    async def fetch_html(
+        self,
+        url: str,
+        agent: str,
+        retries: Optional[int] = None,
+        as_bytes: bool = False
+    ) -> Union[str, bytes, FetchError]:
         headers = {
             "User-Agent": agent
         }
 
-        for attempt in range(retries):
-            try:
-                response = await self.client.get(url, headers=headers)
-                response.raise_for_status()
-
-                content = response.text
-                html = BeautifulSoup(content, 'html.parser').prettify()
+        response = await self.request(url, headers, retries)
+        if isinstance(response, FetchError):
+            return response
 
-                return html
+        return response.content if as_bytes else response.text
 
-            except Exception as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    return None
+    async def fetch_document(
+        self,
+        url: str,
+        agent: str,
+        retries: Optional[int] = None,
+        parser: Optional[str] = None
+    ) -> Union[HtmlDocument, FetchError]:
+        headers = {
+            "User-Agent": agent
+        }
 
-        return None
+        response = await self.request(url, headers, retries)
+        if isinstance(response, FetchError):
+            return response
 
-    async def fetch_json(self, url: str, retries: int = 3) -> Optional[Dict[str, Any]]:
-        if not self.client:
-            return None
+        return HtmlDocument(response.content, response.encoding or 'utf-8', parser=parser, url=url)
 
+    async def fetch_json(self, url: str, retries: Optional[int] = None) -> Union[Any, FetchError]:
         headers = {
             "Accept": "application/json"
         }
 
-        for attempt in range(retries):
-            try:
-                response = await self.client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                return data
+        response = await self.request(url, headers, retries)
+        if isinstance(response, FetchError):
+            return response
 
-            except Exception as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    return None
+        try:
+            return response.json()
+        except ValueError as e:
+            return FetchError(url, FetchError.FATAL, status_code=response.status_code, exception=e)
+
+    async def stream_json_array(self, url: str, retries: Optional[int] = None) -> AsyncIterator[Union[Any, FetchError]]:
+        headers = {
+            "Accept": "application/json"
+        }
+
+        response = await self.request(url, headers, retries, stream=True)
+        if isinstance(response, FetchError):
+            yield response
+            return
 
-        return None
\ No newline at end of file
+        decoder = JSONArrayStreamDecoder()
+        text_decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        try:
+            async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                for item in decoder.feed(text_decoder.decode(chunk)):
+                    yield item
+            for item in decoder.feed(text_decoder.decode(b'', final=True)) + decoder.close():
+                yield item
+        except ValueError as e:
+            yield FetchError(url, FetchError.FATAL, status_code=response.status_code, exception=e)
+        except httpx.HTTPError as e:
+            yield FetchError(url, FetchError.INTERRUPTED, status_code=response.status_code, exception=e)
+        finally:
+            await response.aclose()
@@ -0,0 +1,137 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional, Tuple, Type
+import httpx
+
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+RETRY_AFTER_STATUS_CODES: FrozenSet[int] = frozenset({429, 503})
+RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class FetchError:
+    FATAL = 'fatal'
+    RETRIES_EXHAUSTED = 'retries_exhausted'
+    CIRCUIT_OPEN = 'circuit_open'
+    INTERRUPTED = 'interrupted'
+
+    def __init__(
+        self,
+        url: str,
+        reason: str,
+        status_code: Optional[int] = None,
+        exception: Optional[BaseException] = None
+    ) -> None:
+        self.url = url
+        self.reason = reason
+        self.status_code = status_code
+        self.exception = exception
+
+    def __repr__(self) -> str:
+        detail = self.status_code or (type(self.exception).__name__ if self.exception else '')
+        return f"FetchError({self.reason}, {detail}, {self.url})"
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_retry_after: float = 120.0,
+        retryable_status_codes: FrozenSet[int] = RETRYABLE_STATUS_CODES,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retryable_status_codes = retryable_status_codes
+        self.retryable_exceptions = retryable_exceptions
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retryable_status_codes
+
+    def is_retryable_exception(self, exception: BaseException) -> bool:
+        return isinstance(exception, self.retryable_exceptions)
+
+    def retry_after(self, response: Optional[httpx.Response]) -> Optional[float]:
+        if response is None or response.status_code not in RETRY_AFTER_STATUS_CODES:
+            return None
+
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+
+        return min(max(seconds, 0.0), self.max_retry_after)
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.half_open = False
+        self.probe_started_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self.is_open:
+            return False
+
+        # Po upływie reset_timeout przepuszczamy jedno żądanie próbne (half-open), pozostałe czekają na jego wynik.
+        # Próba, która nie zgłosiła wyniku (np. przerwane zadanie), nie blokuje hosta dłużej niż reset_timeout.
+        now = time.monotonic()
+        if self.half_open and now - self.probe_started_at < self.reset_timeout:
+            return False
+        self.half_open = True
+        self.probe_started_at = now
+        return True
+
+    def release(self) -> None:
+        self.half_open = False
+        self.probe_started_at = None
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.release()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.half_open or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self.release()
+
+
+class CircuitBreakerRegistry:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        host = httpx.URL(url).host
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self.breakers[host]
@@ -0,0 +1,60 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Dict, Optional
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from scraper.operations import RequestsScraper
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_pid: Optional[int] = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _pid
+    if _pid != os.getpid():
+        _loop = None
+        _pid = os.getpid()
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+async def _run_task(coroutine: Awaitable[Any]) -> Any:
+    try:
+        return await coroutine
+    finally:
+        # Zapytania z sync_to_async idą przez osobny wątek, którego połączeń nie zamyka Celery.
+        await sync_to_async(close_old_connections)()
+
+
+def run_async(coroutine: Awaitable[Any]) -> Any:
+    return get_event_loop().run_until_complete(_run_task(coroutine))
+
+
+def http_client_options() -> Dict[str, Any]:
+    return {
+        'http2': getattr(settings, 'SCRAPER_HTTP2', True),
+        'max_connections': getattr(settings, 'SCRAPER_MAX_CONNECTIONS', RequestsScraper.DEFAULT_MAX_CONNECTIONS),
+        'max_keepalive_connections': getattr(
+            settings, 'SCRAPER_MAX_KEEPALIVE_CONNECTIONS', RequestsScraper.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        'keepalive_expiry': getattr(settings, 'SCRAPER_KEEPALIVE_EXPIRY', RequestsScraper.DEFAULT_KEEPALIVE_EXPIRY),
+    }
+
+
+def get_http_client() -> httpx.AsyncClient:
+    return RequestsScraper.shared_client(**http_client_options())
+
+
+def shutdown() -> None:
+    global _loop
+    if _pid != os.getpid() or _loop is None:
+        return
+
+    _loop.run_until_complete(RequestsScraper.close_shared_client())
+    _loop.run_until_complete(_loop.shutdown_asyncgens())
+    _loop.close()
+    _loop = None
@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import importlib.util
+import io
+import os
+import tempfile
+from itertools import chain, zip_longest
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import urljoin
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+from scraper.operations import DownloadQueue, FetchError, HtmlDocument, RequestsScraper
+from web.modules.tenders.models import PublicTender, TenderDocument
+
+DOCUMENTS_BASE_URL = "https://ezamowienia.gov.pl/"
+DEFAULT_DOCUMENTS_DIR = Path(__file__).resolve().parent.parent.parent / 'var' / 'documents'
+USER_AGENT = "Mozilla/5.0 (compatible; TenderScraper/1.0)"
+
+ENRICHMENT_LIMIT = 200
+ENRICHMENT_CONCURRENCY = 8
+ENRICHMENT_PER_HOST = 2
+ENRICHMENT_QUEUE_SIZE = 50
+MAX_ATTEMPTS = 3
+MAX_DOCUMENT_BYTES = 25 * 1024 * 1024
+
+
+class DocumentJob(NamedTuple):
+    tender_uuid: Any
+    kind: str
+    url: str
+
+
+class DownloadedDocument(NamedTuple):
+    content: bytes
+    content_type: str
+    encoding: str
+
+
+def documents_dir() -> Path:
+    return Path(getattr(settings, 'SCRAPER_DOCUMENTS_DIR', DEFAULT_DOCUMENTS_DIR))
+
+
+def document_path(content_hash: str, suffix: str) -> Path:
+    return documents_dir() / content_hash[:2] / f"{content_hash}{suffix}"
+
+
+def write_once(path: Path, data: bytes) -> None:
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Każdy zapis ma własny plik tymczasowy, bo ten sam skrót mogą równocześnie zapisywać dwa zadania kolejki.
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp', delete=False) as temporary:
+        temporary.write(data)
+    try:
+        if path.exists():
+            os.unlink(temporary.name)
+        else:
+            os.replace(temporary.name, path)
+    except BaseException:
+        if os.path.exists(temporary.name):
+            os.unlink(temporary.name)
+        raise
+
+
+def is_pdf(document: DownloadedDocument) -> bool:
+    return document.content.startswith(b'%PDF') or 'pdf' in document.content_type
+
+
+def extract_pdf_text(content: bytes) -> Optional[str]:
+    if importlib.util.find_spec('pypdf') is None:
+        return None
+
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    return "\n".join(page.extract_text() or '' for page in reader.pages).strip()
+
+
+def extract_text(document: DownloadedDocument) -> Optional[str]:
+    if is_pdf(document):
+        return extract_pdf_text(document.content)
+    return HtmlDocument(document.content, document.encoding).text_content()
+
+
+def store_document(document: DownloadedDocument) -> Dict[str, Any]:
+    content_hash = hashlib.sha256(document.content).hexdigest()
+    write_once(document_path(content_hash, '.pdf' if is_pdf(document) else '.html'), document.content)
+
+    # Ten sam plik bywa podpięty pod wiele ogłoszeń, więc tekst wyciągamy raz na skrót treści.
+    text_path = document_path(content_hash, '.txt')
+    if text_path.exists():
+        text = text_path.read_text(encoding='utf-8')
+    else:
+        text = extract_text(document)
+        if text is not None:
+            write_once(text_path, text.encode('utf-8'))
+
+    return {
+        'content_hash': content_hash,
+        'content_type': document.content_type[:100] or None,
+        'size': len(document.content),
+        'text': text,
+    }
+
+
+def document_url(url: Optional[str]) -> Optional[str]:
+    if not url:
+        return None
+    return urljoin(DOCUMENTS_BASE_URL, url)
+
+
+DOCUMENT_URL_FIELDS = (
+    (TenderDocument.KIND_DETAILS, 'details_url'),
+    (TenderDocument.KIND_PDF, 'pdf_url'),
+)
+
+
+def pending_jobs_for_kind(kind: str, field: str, limit: int) -> List[DocumentJob]:
+    finished = TenderDocument.objects.filter(tender=OuterRef('pk'), kind=kind).filter(
+        Q(status=TenderDocument.STATUS_DONE) | Q(attempts__gte=MAX_ATTEMPTS)
+    )
+    tenders = (
+        PublicTender.objects
+        .exclude(**{f"{field}__isnull": True})
+        .exclude(**{field: ''})
+        .filter(~Exists(finished))
+        .order_by('-publication_date')
+        .values_list('uuid', field)[:limit]
+    )
+    return [DocumentJob(uuid, kind, document_url(url)) for uuid, url in tenders]
+
+
+def pending_document_jobs(limit: int = ENRICHMENT_LIMIT) -> List[DocumentJob]:
+    # Strony szczegółów ma każdy przetarg, więc rodzaje przeplatamy, żeby PDF-y nie czekały na wszystkie strony.
+    # Gdy jednego rodzaju brakuje, jego miejsca zajmuje drugi.
+    batches = [pending_jobs_for_kind(kind, field, limit) for kind, field in DOCUMENT_URL_FIELDS]
+    jobs = [job for job in chain.from_iterable(zip_longest(*batches)) if job is not None]
+    return jobs[:max(0, limit)]
+
+
+def save_document(job: DocumentJob, status: str, **fields: Any) -> None:
+    document, _ = TenderDocument.objects.get_or_create(
+        tender_id=job.tender_uuid,
+        kind=job.kind,
+        defaults={'url': job.url, 'status': status}
+    )
+    document.url = job.url
+    document.status = status
+    document.attempts += 1
+    document.error = None
+    for key, value in fields.items():
+        setattr(document, key, value)
+    document.save()
+
+
+async def download(scraper: RequestsScraper, url: str) -> Any:
+    response = await scraper.request(url, {"User-Agent": USER_AGENT}, stream=True)
+    if isinstance(response, FetchError):
+        return response
+
+    try:
+        if int(response.headers.get('Content-Length') or 0) > MAX_DOCUMENT_BYTES:
+            return FetchError(url, FetchError.FATAL, status_code=response.status_code)
+
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes(RequestsScraper.STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_DOCUMENT_BYTES:
+                return FetchError(url, FetchError.FATAL, status_code=response.status_code)
+            chunks.append(chunk)
+    except httpx.HTTPError as e:
+        return FetchError(url, FetchError.INTERRUPTED, status_code=response.status_code, exception=e)
+    finally:
+        await response.aclose()
+
+    return DownloadedDocument(
+        b''.join(chunks),
+        response.headers.get('Content-Type', '').lower(),
+        response.encoding or 'utf-8'
+    )
+
+
+async def enrich_tenders(
+    limit: int = ENRICHMENT_LIMIT,
+    concurrency: int = ENRICHMENT_CONCURRENCY,
+    per_host: int = ENRICHMENT_PER_HOST,
+    queue_size: int = ENRICHMENT_QUEUE_SIZE,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, int]:
+    jobs = await sync_to_async(pending_document_jobs)(limit)
+    totals = {"documents": len(jobs), "done": 0, "failed": 0}
+
+    async with RequestsScraper(client=client) as scraper:
+        async def handle(job: DocumentJob) -> None:
+            document = await download(scraper, job.url)
+            if isinstance(document, FetchError):
+                await sync_to_async(save_document)(job, TenderDocument.STATUS_FAILED, error=repr(document)[:255])
+                totals["failed"] += 1
+                return
+
+            # Parsowanie PDF obciąża CPU, więc nie może blokować pętli obsługującej pozostałe pobrania.
+            try:
+                fields = await asyncio.to_thread(store_document, document)
+            except Exception as e:
+                await sync_to_async(save_document)(job, TenderDocument.STATUS_FAILED, error=repr(e)[:255])
+                totals["failed"] += 1
+                return
+            # Liczniki rosną dopiero po zapisie; błąd zapisu liczy DownloadQueue (queue.failed).
+            await sync_to_async(save_document)(job, TenderDocument.STATUS_DONE, **fields)
+            totals["done"] += 1
+
+        queue = DownloadQueue(
+            handle,
+            lambda job: job.url,
+            concurrency=concurrency,
+            per_host=per_host,
+            maxsize=queue_size
+        )
+        await queue.run(jobs)
+
+    totals["failed"] += queue.failed
+    print(f"Zakończono pobieranie dokumentów: {totals['done']} pobrano, {totals['failed']} błędów")
+    return totals
@@ -0,0 +1,133 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+from django.db import connection, transaction
+from web.modules.tenders.cpv import parse_cpv_codes
+from web.modules.tenders.models import PublicTender, ScraperCursor, TenderCpvCode
+from web.modules.tenders.stats import StatDays
+
+UPSERT_BATCH_SIZE = 500
+
+UPSERT_EXCLUDED_FIELDS = ('uuid', 'tender_id', 'created_at')
+
+UPSERT_UPDATE_FIELDS: List[str] = [
+    field.name for field in PublicTender._meta.concrete_fields
+    if field.name not in UPSERT_EXCLUDED_FIELDS
+]
+
+
+def tender_fingerprint(tender: Dict[str, Any]) -> str:
+    payload = json.dumps(tender, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def chunked(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def upsert_options() -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        'update_conflicts': True,
+        'update_fields': UPSERT_UPDATE_FIELDS,
+    }
+
+    # MySQL (ON DUPLICATE KEY UPDATE) nie pozwala wskazać kolumn konfliktu.
+    if connection.features.supports_update_conflicts_with_target:
+        options['unique_fields'] = ['tender_id']
+
+    return options
+
+
+@transaction.atomic
+def upsert_tenders(
+    tenders: List[Dict[str, Any]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+    stat_days: Optional[StatDays] = None
+) -> Dict[str, int]:
+    unique_tenders: Dict[str, Dict[str, Any]] = {}
+    for tender in tenders:
+        unique_tenders[tender['tender_id']] = tender
+
+    result = {
+        'created': 0,
+        'updated': 0,
+        'unchanged': 0,
+        'skipped': len(tenders) - len(unique_tenders),
+    }
+
+    options = upsert_options()
+    # Statystyki dzienne przelicza wywołujący, już poza tą transakcją.
+    stat_days = stat_days if stat_days is not None else StatDays()
+
+    for chunk in chunked(list(unique_tenders.values()), batch_size):
+        tender_ids = [tender['tender_id'] for tender in chunk]
+        existing = {
+            tender_id: (content_hash, publication_date, submission_deadline)
+            for tender_id, content_hash, publication_date, submission_deadline in
+            PublicTender.objects.filter(tender_id__in=tender_ids).values_list(
+                'tender_id', 'content_hash', 'publication_date', 'submission_deadline'
+            )
+        }
+
+        changed: List[PublicTender] = []
+        for tender in chunk:
+            content_hash = tender.get('content_hash') or tender_fingerprint(tender)
+            if tender['tender_id'] not in existing:
+                result['created'] += 1
+            elif existing[tender['tender_id']][0] == content_hash:
+                result['unchanged'] += 1
+                continue
+            else:
+                result['updated'] += 1
+                stat_days.add(*existing[tender['tender_id']][1:])
+            stat_days.add(tender.get('publication_date'), tender.get('submission_deadline'))
+            changed.append(PublicTender(**{**tender, 'content_hash': content_hash}))
+
+        if changed:
+            PublicTender.objects.bulk_create(changed, **options)
+            sync_cpv_codes(changed)
+
+    return result
+
+
+def sync_cpv_codes(tenders: List[PublicTender]) -> None:
+    # Przy konflikcie baza zachowuje istniejące uuid, więc nie można ufać pk z bulk_create.
+    uuids = dict(
+        PublicTender.objects.filter(tender_id__in=[tender.tender_id for tender in tenders])
+        .values_list('tender_id', 'uuid')
+    )
+
+    TenderCpvCode.objects.filter(tender_id__in=uuids.values()).delete()
+    TenderCpvCode.objects.bulk_create([
+        TenderCpvCode(tender_id=uuids[tender.tender_id], code=code)
+        for tender in tenders
+        if tender.tender_id in uuids
+        for code in parse_cpv_codes(tender.cpv_code)
+    ])
+
+
+def get_cursor(source: str) -> Optional[Tuple[datetime, str]]:
+    cursor = ScraperCursor.objects.filter(source=source).first()
+    if cursor is None:
+        return None
+    return cursor.last_published_at, cursor.last_tender_id
+
+
+def save_cursor(source: str, published_at: datetime, tender_id: str) -> None:
+    ScraperCursor.objects.update_or_create(
+        source=source,
+        defaults={
+            'last_published_at': published_at,
+            'last_tender_id': tender_id,
+        }
+    )
+
+
+def advance_cursor(source: str, published_at: datetime, tender_id: str) -> bool:
+    stored = get_cursor(source)
+    if stored is not None and published_at < stored[0]:
+        return False
+    save_cursor(source, published_at, tender_id)
+    return True
@@ -1,25 +1,38 @@
-import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from scraper.operations import RequestsScraper
-from web.modules.tenders.models import PublicTender
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Union
+import httpx
+from scraper.operations import RequestsScraper, PageFetcher
+from scraper.services.ingestion_service import upsert_tenders, get_cursor, advance_cursor, tender_fingerprint, UPSERT_BATCH_SIZE
+from web.modules.tenders.generation import bump_public_tenders_generation
+from web.modules.tenders.stats import StatDays, refresh_daily_stats
 from asgiref.sync import sync_to_async
-from django.db import transaction
-
-semaphore = asyncio.Semaphore(8)
 
 BASE_API_URL = "https://ezamowienia.gov.pl/mo-board/api/v1/Board/Search"
 
+SOURCE_NAME = "ezamowienia-bzp"
+
+PAGE_SIZE = 10
+FETCH_CONCURRENCY = 4
+REQUESTS_PER_SECOND = 2.0
+
+RESULT_COUNTERS = ("fetched", "processed", "known", "created", "updated", "unchanged", "skipped", "errors")
+
 async def build_api_url(
     days_back: int,
     page_number: int,
-    page_size: int
+    page_size: int,
+    published_from: Optional[Union[date, datetime]] = None,
+    published_to: Optional[date] = None
 ) -> str:
-    from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%dT00:00:00.000Z")
+    if published_from is None:
+        published_from = datetime.now() - timedelta(days=days_back)
+    from_date = published_from.strftime("%Y-%m-%dT00:00:00.000Z")
+    to_date = f"publicationDateTo={published_to.strftime('%Y-%m-%dT23:59:59.999Z')}&" if published_to else ""
 
     url = (
         f"{BASE_API_URL}?"
         f"publicationDateFrom={from_date}&"
+        f"{to_date}"
         f"SortingColumnName=PublicationDate&"
         f"SortingDirection=DESC&"
         f"PageNumber={page_number}&"
@@ -31,44 +44,224 @@ async def build_api_url(
 
 async def fetch_tenders(
     days_back: int = 7,
-    max_pages: int = 10000
+    max_pages: int = 10000,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    pages_per_batch: int = 1,
+    page_size: int = PAGE_SIZE,
+    concurrency: int = FETCH_CONCURRENCY,
+    requests_per_second: float = REQUESTS_PER_SECOND,
+    ordered: bool = True,
+    incremental: bool = True,
+    backfill: bool = False,
+    published_from: Optional[date] = None,
+    published_to: Optional[date] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    stream: bool = False,
+    refresh_stats: bool = True
 ):
-    async with RequestsScraper() as scraper:
-        page_number = 1
-        has_more_data = True
+    stored_cursor = None
+    if incremental:
+        stored_cursor = await sync_to_async(get_cursor)(SOURCE_NAME)
+    cursor = None if backfill else stored_cursor
+
+    async with RequestsScraper(client=client) as scraper:
         tenders = 0
-        processed = 0
-        while has_more_data and page_number <= max_pages:
-            url = await build_api_url(
+        known = 0
+        high_water_mark: Optional[Tuple[datetime, str]] = None
+        totals = {
+            "created": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "skipped": 0
+        }
+        pending: List[Dict[str, Any]] = []
+        pending_pages = 0
+        stat_days = StatDays()
+
+        async def flush() -> None:
+            nonlocal pending, pending_pages
+            if pending:
+                result = await sync_to_async(upsert_tenders)(pending, batch_size, stat_days)
+                for key, value in result.items():
+                    totals[key] += value
+            pending = []
+            pending_pages = 0
+
+        async def url_for_page(page_number: int) -> str:
+            return await build_api_url(
                 days_back=days_back,
                 page_number=page_number,
-                page_size=10
+                page_size=page_size,
+                published_from=cursor[0] if cursor else published_from,
+                published_to=published_to
             )
 
-            async with semaphore:
-                data = await scraper.fetch_json(url)
-                if not data:
-                    has_more_data = False
-                    break
-                else:
-                    process_tenders: List[Dict[str, Any]] = []
-                    process_tenders.extend(data)
-                    for tender in process_tenders:
-                        tenders += 1
-                        result = await process_tender(tender)
-                        if result:
-                            processed += 1
-                        print(f"Zakończono okresowe pobieranie ofert: {tenders} pobrano, {processed} przetworzono")
-                page_number += 1
-                await asyncio.sleep(1)
+        fetcher = PageFetcher(
+            scraper,
+            url_for_page,
+            concurrency=concurrency,
+            requests_per_second=requests_per_second,
+            ordered=ordered,
+            max_pages=max_pages
+        )
+
+        async def consume(page_number: int, tender: Dict[str, Any]) -> None:
+            nonlocal tenders, known, high_water_mark
+            tenders += 1
+            published_at = parse_published_at(tender)
+
+            if cursor and is_known_tender(tender, published_at, cursor):
+                known += 1
+                fetcher.stop_after(page_number)
+                return
+
+            normalized = process_tender(tender)
+            if normalized:
+                pending.append(normalized)
+                if published_at and (high_water_mark is None or published_at > high_water_mark[0]):
+                    high_water_mark = (published_at, normalized['tender_id'])
+            else:
+                totals["skipped"] += 1
+
+            if len(pending) >= batch_size:
+                await flush()
+
+        async def page_done() -> None:
+            nonlocal pending_pages
+            pending_pages += 1
+            if pending_pages >= pages_per_batch:
+                await flush()
+            print(f"Zakończono okresowe pobieranie ofert: {tenders} pobrano, {totals['created'] + totals['updated']} przetworzono")
+
+        if stream:
+            current_page = None
+            async for page_number, tender in fetcher.stream_items():
+                if current_page is not None and page_number != current_page:
+                    await page_done()
+                current_page = page_number
+                await consume(page_number, tender)
+            if current_page is not None:
+                await page_done()
+        else:
+            async for page_number, data in fetcher.pages():
+                for tender in data:
+                    await consume(page_number, tender)
+                await page_done()
+
+        await flush()
+
+        failed_pages = fetcher.failed_pages
+        truncated = fetcher.truncated or bool(failed_pages)
+        for page_number, error in sorted(failed_pages.items()):
+            print(f"Nie udało się pobrać strony {page_number}: {error!r}")
+
+    # Części pobierane równolegle przeliczają statystyki raz, w callbacku chorda.
+    if refresh_stats and stat_days:
+        await sync_to_async(refresh_daily_stats)(stat_days.publication, stat_days.deadline)
+
+    if totals["created"] or totals["updated"]:
+        await sync_to_async(bump_public_tenders_generation)()
+
+    # Przy brakujących stronach kursor zostaje w miejscu, żeby kolejny przebieg uzupełnił lukę.
+    if incremental and high_water_mark and not truncated:
+        await sync_to_async(advance_cursor)(SOURCE_NAME, *high_water_mark)
 
     return {
         "fetched": tenders,
-        "processed": processed
+        "processed": totals["created"] + totals["updated"],
+        "known": known,
+        **totals,
+        "errors": len(failed_pages),
+        "truncated": truncated,
+        "cursor": [high_water_mark[0].isoformat(), high_water_mark[1]] if high_water_mark else None,
+        "stat_days": None if refresh_stats else stat_days.as_dict()
     }
 
 
-async def process_tender(tender_data: Dict[str, Any]) -> Optional[Any]:
+def shard_date_ranges(days_back: int, shards: int, today: Optional[date] = None) -> List[Tuple[date, date]]:
+    today = today or datetime.now().date()
+    start = today - timedelta(days=days_back)
+    total_days = days_back + 1
+    shards = max(1, min(shards, total_days))
+
+    ranges = []
+    for index in range(shards):
+        first = start + timedelta(days=total_days * index // shards)
+        last = start + timedelta(days=total_days * (index + 1) // shards - 1)
+        ranges.append((first, last))
+    return ranges
+
+
+def merge_shard_results(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {counter: 0 for counter in RESULT_COUNTERS}
+    merged["shards"] = 0
+    merged["truncated"] = False
+    merged["cursor"] = None
+    stat_days = StatDays()
+
+    for result in results:
+        merged["shards"] += 1
+        for counter in RESULT_COUNTERS:
+            merged[counter] += result.get(counter, 0)
+        merged["truncated"] = merged["truncated"] or result.get("truncated", False)
+        cursor = result.get("cursor")
+        if cursor and (
+            merged["cursor"] is None
+            or datetime.fromisoformat(cursor[0]) > datetime.fromisoformat(merged["cursor"][0])
+        ):
+            merged["cursor"] = cursor
+        stat_days.update(StatDays.from_dict(result.get("stat_days")))
+
+    merged["stat_days"] = stat_days.as_dict()
+    return merged
+
+
+def refresh_merged_stats(merged: Dict[str, Any]) -> bool:
+    stat_days = StatDays.from_dict(merged.get("stat_days"))
+    if not stat_days:
+        return False
+    refresh_daily_stats(stat_days.publication, stat_days.deadline)
+    bump_public_tenders_generation()
+    return True
+
+
+def record_merged_cursor(merged: Dict[str, Any]) -> bool:
+    if not merged.get("cursor") or merged.get("truncated"):
+        return False
+    published_at, tender_id = merged["cursor"]
+    return advance_cursor(SOURCE_NAME, datetime.fromisoformat(published_at), tender_id)
+
+
+def parse_published_at(tender_data: Dict[str, Any]) -> Optional[datetime]:
+    publication_date_str = tender_data.get('publicationDate')
+    if not publication_date_str:
+        return None
+
+    try:
+        published_at = datetime.fromisoformat(publication_date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+    return published_at
+
+
+def is_known_tender(
+    tender_data: Dict[str, Any],
+    published_at: Optional[datetime],
+    cursor: Tuple[datetime, str]
+) -> bool:
+    last_published_at, last_tender_id = cursor
+    if published_at is None:
+        return False
+    if published_at < last_published_at:
+        return True
+    tender_id = tender_data.get('tenderId') or tender_data.get('moIdentifier')
+    return published_at == last_published_at and tender_id == last_tender_id
+
+
+def process_tender(tender_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     try:
         tender_id = tender_data.get('tenderId')
         announcement_number = tender_data.get('noticeNumber', '')
@@ -117,7 +310,8 @@ async def process_tender(tender_data: Dict[str, Any]) -> Optional[Any]:
         if not tender_id:
             return None
 
-        defaults = {
+        tender = {
+            'tender_id': tender_id,
             'announcement_number': announcement_number,
             'announcement_type': announcement_type,
             'order_name': order_name,
@@ -153,13 +347,13 @@ async def process_tender(tender_data: Dict[str, Any]) -> Optional[Any]:
             'pdf_url': pdf_url
         }
 
-        return await sync_to_async(create_or_update_tender)(tender_id=tender_id, defaults=defaults)
+        # Data zastępcza (dzisiejsza) zmienia się codziennie, więc nie może wpływać na skrót treści.
+        fingerprinted = tender if publication_date_str else {
+            key: value for key, value in tender.items() if key != 'publication_date'
+        }
+        tender['content_hash'] = tender_fingerprint(fingerprinted)
+        return tender
 
     except Exception as e:
         print(f"Błąd podczas przetwarzania przetargu: {str(e)}")
         return None
-
-@transaction.atomic
-def create_or_update_tender(tender_id, defaults):
-    tender, created = PublicTender.objects.update_or_create(tender_id=tender_id, defaults=defaults)
-    return tender
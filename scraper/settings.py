@@ -1,29 +1,31 @@
-CELERY_BROKER_URL = 'redis://:zaq1@WSX@redis:6379/0'
+import os
+from web.config.base import *  # noqa: F401,F403
+
 CELERY_BEAT_SCHEDULE = {
     'run-scraper-every-2-hours': {
         'task': 'scraper.tasks.run_periodic_scraper',
         'schedule': 7200.0,
     },
+    'enrich-tender-documents-every-30-minutes': {
+        'task': 'scraper.tasks.enrich_tender_documents',
+        'schedule': 1800.0,
+    },
 }
-CELERY_TIMEZONE = 'Europe/Warsaw'
+
+# Pobieranie dokumentów ma osobną kolejkę i workera, żeby nie opóźniało pobierania listy ofert.
+CELERY_TASK_ROUTES = {
+    'scraper.tasks.enrich_tender_documents': {'queue': 'enrichment'},
+}
+
 INSTALLED_APPS = [
     'django.contrib.auth',
     'django.contrib.contenttypes',
-    'django.contrib.staticfiles',
     'web.modules.tenders',
     'web.modules.users',
 ]
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        'NAME': 'scrapper',
-        'USER': 'root',
-        'PASSWORD': 'root',
-        'HOST': 'db',
-        'PORT': '3306',
-        'OPTIONS': {
-            'charset': 'utf8mb4',
-        }
-    }
-}
\ No newline at end of file
+SCRAPER_HTTP2 = os.getenv('SCRAPER_HTTP2', 'True').lower() == 'true'
+SCRAPER_MAX_CONNECTIONS = int(os.getenv('SCRAPER_MAX_CONNECTIONS', 20))
+SCRAPER_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('SCRAPER_MAX_KEEPALIVE_CONNECTIONS', 10))
+SCRAPER_KEEPALIVE_EXPIRY = float(os.getenv('SCRAPER_KEEPALIVE_EXPIRY', 30))
+SCRAPER_DOCUMENTS_DIR = os.getenv('SCRAPER_DOCUMENTS_DIR', '/app/var/documents')
@@ -1,18 +1,54 @@
-from celery import shared_task
-import asyncio
+from celery import shared_task, chord
+from datetime import date
+
 
 @shared_task
-def run_periodic_scraper():
-    from .services.scraper_service import fetch_tenders, process_tender
+def run_periodic_scraper(days_back: int = 7, backfill: bool = False, shards: int = 1):
+    from .runtime import run_async, get_http_client
+    from .services.scraper_service import fetch_tenders, shard_date_ranges
+
+    if shards > 1:
+        ranges = shard_date_ranges(days_back, shards)
+        print(f"Rozpoczynam pobieranie ofert w {len(ranges)} częściach...")
+        result = chord(
+            scrape_shard.s(first.isoformat(), last.isoformat()) for first, last in ranges
+        )(aggregate_shard_results.s())
+        return {"shards": len(ranges), "chord_id": result.id}
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    print("Rozpoczynam okresowe pobieranie ofert...")
+    return run_async(fetch_tenders(days_back=days_back, backfill=backfill, client=get_http_client()))
 
-    async def run_scraper():
-        print("Rozpoczynam okresowe pobieranie ofert...")
 
-        return await fetch_tenders()
+@shared_task
+def scrape_shard(published_from: str, published_to: str):
+    from .runtime import run_async, get_http_client
+    from .services.scraper_service import fetch_tenders
 
-    return asyncio.run(run_scraper())
+    print(f"Pobieranie ofert z zakresu {published_from} - {published_to}")
+    return run_async(fetch_tenders(
+        incremental=False,
+        published_from=date.fromisoformat(published_from),
+        published_to=date.fromisoformat(published_to),
+        client=get_http_client(),
+        refresh_stats=False
+    ))
 
 
+@shared_task
+def aggregate_shard_results(results):
+    from .services.scraper_service import merge_shard_results, record_merged_cursor, refresh_merged_stats
+
+    merged = merge_shard_results(results)
+    record_merged_cursor(merged)
+    refresh_merged_stats(merged)
+    print(f"Zakończono pobieranie ofert: {merged['fetched']} pobrano, {merged['processed']} przetworzono")
+    return merged
+
+
+@shared_task
+def enrich_tender_documents(limit: int = 200):
+    from .runtime import run_async, get_http_client
+    from .services.enrichment_service import enrich_tenders
+
+    print("Rozpoczynam pobieranie szczegółów i dokumentów PDF...")
+    return run_async(enrich_tenders(limit=limit, client=get_http_client()))
@@ -0,0 +1,59 @@
+import json
+import unittest
+
+from scraper.operations.json_stream import JSONArrayStreamDecoder
+
+
+def decode_in_chunks(chunks):
+    decoder = JSONArrayStreamDecoder()
+    items = []
+    for chunk in chunks:
+        items.extend(decoder.feed(chunk))
+    return items + decoder.close()
+
+
+class JSONArrayStreamDecoderTests(unittest.TestCase):
+    def test_numbers_split_across_chunks(self):
+        cases = [
+            (['[12.', '5]'], [12.5]),
+            (['[1e', '3]'], [1e3]),
+            (['[1E', '+2, 4]'], [1e2, 4]),
+            (['[2.5e', '-1]'], [0.25]),
+            (['[-', '7]'], [-7]),
+            (['[12', '3]'], [123]),
+            (['[1', ']'], [1]),
+        ]
+        for chunks, expected in cases:
+            with self.subTest(chunks=chunks):
+                self.assertEqual(decode_in_chunks(chunks), expected)
+
+    def test_every_split_point(self):
+        payload = json.dumps([{"id": 1, "name": "Ąę \"x\""}, 12.5, -3e-2, 0, True, None, "końcówka"])
+        expected = json.loads(payload)
+        for split in range(len(payload) + 1):
+            with self.subTest(split=split):
+                self.assertEqual(decode_in_chunks([payload[:split], payload[split:]]), expected)
+
+    def test_number_is_held_until_delimiter(self):
+        decoder = JSONArrayStreamDecoder()
+        self.assertEqual(decoder.feed('[12'), [])
+        self.assertEqual(decoder.feed('.5'), [])
+        self.assertEqual(decoder.feed(' '), [12.5])
+        self.assertEqual(decoder.feed(']'), [])
+        self.assertEqual(decoder.close(), [])
+
+    def test_incomplete_array_raises(self):
+        decoder = JSONArrayStreamDecoder()
+        decoder.feed('[1, 2')
+        with self.assertRaises(ValueError):
+            decoder.close()
+
+    def test_invalid_number_suffix_raises(self):
+        decoder = JSONArrayStreamDecoder()
+        decoder.feed('[12x]')
+        with self.assertRaises(ValueError):
+            decoder.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
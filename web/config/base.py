@@ -0,0 +1,56 @@
+import os
+from urllib.parse import quote
+from dotenv import load_dotenv
+
+load_dotenv()
+
+AUTH_USER_MODEL = 'users.User'
+
+DB_ENGINE = os.getenv('DB_ENGINE', 'django.db.backends.mysql')
+
+DATABASES = {
+    'default': {
+        'ENGINE': DB_ENGINE,
+        'NAME': os.getenv('DB_NAME', 'scrapper'),
+        'USER': os.getenv('DB_USER', 'root'),
+        'PASSWORD': os.getenv('DB_PASSWORD', 'root'),
+        'HOST': os.getenv('DB_HOST', 'db'),
+        'PORT': os.getenv('DB_PORT', '3306'),
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 0)),
+        'OPTIONS': {
+            'charset': 'utf8mb4',
+        } if DB_ENGINE == 'django.db.backends.mysql' else {},
+    }
+}
+
+REDIS_HOST = os.getenv('REDIS_HOST', 'redis')
+REDIS_PORT = os.getenv('REDIS_PORT', '6379')
+REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
+REDIS_URL = f"redis://:{quote(REDIS_PASSWORD, safe='')}@{REDIS_HOST}:{REDIS_PORT}"
+
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'redis')
+
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': f"{REDIS_URL}/1",
+            'KEY_PREFIX': 'tenders',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'tenders',
+        }
+    }
+
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', f"{REDIS_URL}/0")
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', f"{REDIS_URL}/2")
+CELERY_RESULT_EXPIRES = 24 * 60 * 60
+CELERY_TIMEZONE = 'Europe/Warsaw'
+
+TIME_ZONE = 'Europe/Warsaw'
+
+USE_TZ = True
@@ -1,9 +1,7 @@
 from pathlib import Path
 import os
 from datetime import timedelta
-from dotenv import load_dotenv
-
-load_dotenv()
+from web.config.base import *  # noqa: F401,F403
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -31,8 +29,6 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
 ]
 
-AUTH_USER_MODEL = 'users.User'
-
 CORS_ALLOW_ALL_ORIGINS = True
 
 ROOT_URLCONF = 'web.config.urls'
@@ -55,19 +51,7 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'web.config.wsgi.application'
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        'NAME': 'scrapper',
-        'USER': 'root',
-        'PASSWORD': 'root',
-        'HOST': 'db',
-        'PORT': '3306',
-        'OPTIONS': {
-            'charset': 'utf8mb4',
-        }
-    }
-}
+TENDERS_RESPONSE_CACHE_TIMEOUT = int(os.getenv('TENDERS_RESPONSE_CACHE_TIMEOUT', 3 * 60 * 60))
 
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -76,14 +60,10 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = 'pl'
 
-TIME_ZONE = 'Europe/Warsaw'
-
 USE_I18N = True
 
 USE_L10N = True
 
-USE_TZ = True
-
 STATIC_URL = '/static/'
 
 REST_FRAMEWORK = {
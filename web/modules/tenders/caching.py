@@ -0,0 +1,104 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, QuerySet
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .generation import get_public_tenders_generation
+
+PUBLIC_TENDERS_RESPONSE_KEY = 'tenders:public:response:{}:{}'
+
+
+def public_response_cache_key(request: Request, generation: int, extra: str = '') -> str:
+    variant = f"{request.accepted_renderer.format}:{request.build_absolute_uri()}:{extra}"
+    return PUBLIC_TENDERS_RESPONSE_KEY.format(generation, hashlib.md5(variant.encode('utf-8')).hexdigest())
+
+
+def etag_for(cache_key: str) -> str:
+    return f'W/"{hashlib.md5(cache_key.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get('If-None-Match', '')
+    return etag in (tag.strip() for tag in if_none_match.split(',')) or if_none_match.strip() == '*'
+
+
+class PublicResponseCacheMixin:
+    def cached_public_response(
+        self,
+        request: Request,
+        render: Callable[[], Response],
+        is_public: Callable[[], bool] = lambda: True,
+        extra_key: str = ''
+    ) -> Response:
+        cache_key = public_response_cache_key(request, get_public_tenders_generation(), extra_key)
+        etag = etag_for(cache_key)
+
+        data = cache.get(cache_key)
+        if data is not None:
+            if etag_matches(request, etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+            return Response(data, headers={'ETag': etag})
+
+        response = render()
+        if response.status_code == status.HTTP_200_OK and is_public():
+            cache.set(cache_key, response.data, timeout=getattr(settings, 'TENDERS_RESPONSE_CACHE_TIMEOUT', None))
+            response['ETag'] = etag
+        return response
+
+
+def queryset_validators(request: Request, querysets: Sequence[Tuple[QuerySet, str]]) -> Tuple[str, Optional[datetime]]:
+    parts = [request.accepted_renderer.format, request.build_absolute_uri(), str(request.user.pk)]
+
+    for queryset, field in querysets:
+        summary = queryset.order_by().aggregate(last_modified=Max(field), count=Count('pk'))
+        modified = summary['last_modified']
+        parts.append(f"{summary['count']}:{modified.isoformat() if modified else ''}")
+
+    # Usunięcie elementu kolekcji nie zmienia max(updated_at), więc kolekcje walidujemy tylko ETagiem (z liczbą wierszy).
+    return etag_for('|'.join(parts)), None
+
+
+def instance_validators(request: Request, instance: Any, field: str = 'updated_at') -> Tuple[str, Optional[datetime]]:
+    modified = getattr(instance, field)
+    parts = [request.accepted_renderer.format, request.build_absolute_uri(), str(instance.pk), modified.isoformat()]
+    return etag_for('|'.join(parts)), modified
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if request.headers.get('If-None-Match') is not None:
+        return etag_matches(request, etag)
+
+    if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return (
+        if_modified_since is not None and
+        last_modified is not None and
+        int(last_modified.timestamp()) <= if_modified_since
+    )
+
+
+class ConditionalGetMixin:
+    def conditional_response(
+        self,
+        request: Request,
+        validators: Tuple[str, Optional[datetime]],
+        render: Callable[[], Response]
+    ) -> Response:
+        etag, last_modified = validators
+        headers: Dict[str, str] = {'ETag': etag}
+        if last_modified is not None:
+            headers['Last-Modified'] = http_date(last_modified.timestamp())
+
+        if is_not_modified(request, etag, last_modified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response = render()
+        if response.status_code == status.HTTP_200_OK:
+            for header, value in headers.items():
+                response[header] = value
+        return response
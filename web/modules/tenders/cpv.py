@@ -0,0 +1,22 @@
+import re
+from typing import List, Optional
+
+CPV_CODE_PATTERN = re.compile(r'(?<!\d)(\d{8})(?:-\d)?(?!\d)')
+CPV_PREFIX_MIN_LENGTH = 2
+
+
+def parse_cpv_codes(raw: Optional[str]) -> List[str]:
+    if not raw:
+        return []
+    return list(dict.fromkeys(CPV_CODE_PATTERN.findall(raw)))
+
+
+def normalize_cpv_prefix(value: str) -> Optional[str]:
+    digits = value.strip().split('-')[0]
+    if not digits.isdigit() or len(digits) < CPV_PREFIX_MIN_LENGTH or len(digits) > 8:
+        return None
+
+    prefix = digits.rstrip('0')
+    if len(prefix) < CPV_PREFIX_MIN_LENGTH:
+        prefix = digits[:CPV_PREFIX_MIN_LENGTH]
+    return prefix
@@ -0,0 +1,51 @@
+from datetime import date, timedelta
+from typing import Any, Dict, List
+from django.db.models import Count, Q, QuerySet
+
+TENDER_FACET_FIELDS = ('authority_region', 'order_type', 'tender_type')
+
+DEADLINE_BUCKETS = (
+    ('expired', None, 0),
+    ('week', 0, 7),
+    ('month', 7, 30),
+    ('later', 30, None),
+)
+
+
+def deadline_bucket_condition(today: date, start: Any, end: Any) -> Q:
+    condition = Q(submission_deadline__isnull=False)
+    if start is not None:
+        condition &= Q(submission_deadline__gte=today + timedelta(days=start))
+    if end is not None:
+        condition &= Q(submission_deadline__lt=today + timedelta(days=end))
+    return condition
+
+
+def field_facet(queryset: QuerySet, field: str) -> List[Dict[str, Any]]:
+    rows = queryset.values(field).annotate(count=Count('pk')).order_by('-count', field)
+    return [{'value': row[field], 'count': row['count']} for row in rows]
+
+
+def tender_facets(queryset: QuerySet, today: date) -> Dict[str, Any]:
+    queryset = queryset.order_by()
+
+    aggregates: Dict[str, Any] = {'total': Count('pk')}
+    for name, start, end in DEADLINE_BUCKETS:
+        aggregates[f"deadline_{name}"] = Count('pk', filter=deadline_bucket_condition(today, start, end))
+    aggregates['deadline_none'] = Count('pk', filter=Q(submission_deadline__isnull=True))
+    aggregates['below_eu_true'] = Count('pk', filter=Q(is_tender_amount_below_eu=True))
+    aggregates['below_eu_false'] = Count('pk', filter=Q(is_tender_amount_below_eu=False))
+    aggregates['below_eu_none'] = Count('pk', filter=Q(is_tender_amount_below_eu__isnull=True))
+    summary = queryset.aggregate(**aggregates)
+
+    facets: Dict[str, Any] = {field: field_facet(queryset, field) for field in TENDER_FACET_FIELDS}
+    facets['is_tender_amount_below_eu'] = [
+        {'value': value, 'count': summary[f"below_eu_{key}"]}
+        for key, value in (('true', True), ('false', False), ('none', None))
+    ]
+    facets['deadline'] = [
+        {'value': name, 'count': summary[f"deadline_{name}"]}
+        for name in [bucket[0] for bucket in DEADLINE_BUCKETS] + ['none']
+    ]
+
+    return {'count': summary['total'], 'facets': facets}
@@ -0,0 +1,48 @@
+from typing import Any, Dict, List
+from django.db.models import Q, QuerySet
+from rest_framework import filters
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from .cpv import normalize_cpv_prefix
+from .models import TenderCpvCode
+
+
+class CpvFilter(filters.BaseFilterBackend):
+    cpv_query_param = 'cpv'
+
+    def get_cpv_prefixes(self, request: Request) -> List[str]:
+        values = request.query_params.get(self.cpv_query_param, '')
+        prefixes: List[str] = []
+        for value in filter(None, (item.strip() for item in values.split(','))):
+            prefix = normalize_cpv_prefix(value)
+            if prefix is None:
+                raise ValidationError({self.cpv_query_param: f"Nieprawidłowy kod CPV: {value}."})
+            prefixes.append(prefix)
+        return list(dict.fromkeys(prefixes))
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view: Any) -> QuerySet:
+        prefixes = self.get_cpv_prefixes(request)
+        if not prefixes:
+            return queryset
+
+        condition = Q()
+        for prefix in prefixes:
+            condition |= Q(code__startswith=prefix)
+
+        matching = TenderCpvCode.objects.filter(condition).values('tender_id')
+        return queryset.filter(uuid__in=matching)
+
+    def get_schema_operation_parameters(self, view: Any) -> List[Dict[str, Any]]:
+        return [
+            {
+                'name': self.cpv_query_param,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    "Kody CPV lub ich prefiksy oddzielone przecinkami, np. 45 (dział), "
+                    "452 (grupa), 4523 (klasa) albo 45233140-2."
+                ),
+                'schema': {'type': 'string'},
+            },
+        ]
@@ -0,0 +1,19 @@
+from django.core.cache import cache
+
+PUBLIC_TENDERS_GENERATION_KEY = 'tenders:public:generation'
+
+
+def get_public_tenders_generation() -> int:
+    generation = cache.get(PUBLIC_TENDERS_GENERATION_KEY)
+    if generation is None:
+        cache.add(PUBLIC_TENDERS_GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(PUBLIC_TENDERS_GENERATION_KEY, 1)
+    return generation
+
+
+def bump_public_tenders_generation() -> int:
+    try:
+        return cache.incr(PUBLIC_TENDERS_GENERATION_KEY)
+    except ValueError:
+        cache.add(PUBLIC_TENDERS_GENERATION_KEY, 2, timeout=None)
+        return cache.get(PUBLIC_TENDERS_GENERATION_KEY, 2)
@@ -0,0 +1,130 @@
+import uuid
+from datetime import date, timedelta
+from typing import Any, List, Tuple
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.db.models import QuerySet
+
+from web.modules.tenders.models import PublicTender, FollowTender, PrivateTender, TenderNote
+from web.modules.tenders.pagination import KeysetPagination
+from web.modules.tenders.views import PrivateTenderViewSet
+
+User = get_user_model()
+
+SEED_PREFIX = 'EXPLAIN-'
+SEED_USERNAME = 'explain-user'
+
+
+class Command(BaseCommand):
+    help = "Uruchamia EXPLAIN dla najczęstszych zapytań API i sprawdza, czy używają indeksów."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--seed', type=int, default=0, help="Liczba syntetycznych przetargów do wygenerowania.")
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--cleanup', action='store_true', help="Usuwa dane wygenerowane przez --seed.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['cleanup']:
+            self.cleanup()
+            return
+
+        user, _ = User.objects.get_or_create(username=SEED_USERNAME)
+
+        if options['seed']:
+            self.seed(user, options['seed'], options['batch_size'])
+
+        failures = []
+        for name, queryset, index_names in self.hot_queries(user):
+            plan = queryset.explain()
+            used = any(index_name in plan for index_name in index_names)
+            self.stdout.write(f"[{'OK' if used else 'BRAK'}] {name} -> {index_names[0]}")
+            self.stdout.write(plan)
+            if not used:
+                failures.append(name)
+
+        if failures:
+            raise CommandError(f"Zapytania bez oczekiwanego indeksu: {', '.join(failures)}")
+
+    def hot_queries(self, user: Any) -> List[Tuple[str, QuerySet, Tuple[str, ...]]]:
+        tender_uuid = FollowTender.objects.filter(user=user).values_list('tender_uuid', flat=True).first() or uuid.uuid4()
+
+        # Lista prywatna: widoczność przez EXISTS, sortowanie widoku i warunek kursora z KeysetPagination.
+        pagination = KeysetPagination()
+        private_tenders = PrivateTender.objects.visible_to(user).order_by(*PrivateTenderViewSet.ordering)
+        latest = private_tenders.values_list('publication_date', 'uuid').first() or (date.today(), uuid.uuid4())
+        private_page = pagination.keyset_queryset(private_tenders, (*latest, False), scan_descending=True)
+
+        return [
+            (
+                "TenderViewSet.list ordering=-publication_date",
+                PublicTender.objects.order_by('-publication_date', '-uuid')[:10],
+                ('tenders_pub_date_uuid_idx',),
+            ),
+            (
+                "TenderViewSet.list ordering=submission_deadline",
+                PublicTender.objects.filter(submission_deadline__gte=date.today()).order_by('submission_deadline')[:10],
+                ('tenders_deadline_idx',),
+            ),
+            (
+                "TenderViewSet.observed",
+                FollowTender.objects.filter(user=user).values_list('tender_uuid', flat=True),
+                ('follow_tender_user_at_idx',),
+            ),
+            (
+                "FollowTenderSerializer.validate",
+                FollowTender.objects.filter(user=user, tender_uuid=tender_uuid),
+                # SQLite nadaje ograniczeniom UNIQUE własne nazwy indeksów.
+                ('follow_tender_user_uuid_uniq', 'sqlite_autoindex_follow_tender'),
+            ),
+            (
+                "TenderNoteViewSet.get_for_tender",
+                TenderNote.objects.filter(user=user, tender_uuid=tender_uuid),
+                ('notes_user_uuid_created_idx',),
+            ),
+            (
+                "PrivateTenderViewSet.list",
+                private_page[:pagination.page_size + 1],
+                ('private_pub_date_uuid_idx',),
+            ),
+        ]
+
+    @transaction.atomic
+    def seed(self, user: Any, count: int, batch_size: int) -> None:
+        today = date.today()
+        offset = PublicTender.objects.filter(tender_id__startswith=SEED_PREFIX).count()
+
+        for start in range(offset, offset + count, batch_size):
+            tenders = [
+                PublicTender(
+                    tender_id=f"{SEED_PREFIX}{number}",
+                    announcement_number=str(number),
+                    announcement_type='ContractNotice',
+                    order_name=f"Zamówienie {number}",
+                    contracting_authority=f"Zamawiający {number % 5000}",
+                    description=f"Opis zamówienia {number}",
+                    authority_city='Warszawa',
+                    authority_region='mazowieckie',
+                    publication_date=today - timedelta(days=number % 3650),
+                    submission_deadline=today + timedelta(days=number % 90),
+                    details_url=f"https://example.com/{number}",
+                )
+                for number in range(start, min(start + batch_size, offset + count))
+            ]
+            PublicTender.objects.bulk_create(tenders, batch_size=batch_size)
+
+            FollowTender.objects.bulk_create(
+                [FollowTender(user=user, tender_uuid=tender.uuid, tender_type='public') for tender in tenders[::100]],
+                ignore_conflicts=True
+            )
+            TenderNote.objects.bulk_create(
+                [TenderNote(user=user, tender_uuid=tender.uuid, tender_type='public', note='-') for tender in tenders[::100]]
+            )
+            self.stdout.write(f"Wygenerowano {min(start + batch_size, offset + count) - offset}/{count}")
+
+    @transaction.atomic
+    def cleanup(self) -> None:
+        FollowTender.objects.filter(user__username=SEED_USERNAME).delete()
+        TenderNote.objects.filter(user__username=SEED_USERNAME).delete()
+        PublicTender.objects.filter(tender_id__startswith=SEED_PREFIX).delete()
+        User.objects.filter(username=SEED_USERNAME).delete()
@@ -0,0 +1,21 @@
+from typing import Any
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from web.modules.tenders.generation import bump_public_tenders_generation
+from web.modules.tenders.stats import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Przelicza od zera tabelę dziennych statystyk przetargów."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--batch-days', type=int, default=31, help="Liczba dni przeliczanych w jednej partii.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            publication_days, deadline_days = rebuild_daily_stats(options['batch_days'])
+        bump_public_tenders_generation()
+        self.stdout.write(
+            f"Przeliczono statystyki dla {publication_days} dni publikacji i {deadline_days} dni terminów."
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0003_alter_publictender_cpv_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScraperCursor',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50, unique=True, verbose_name='Źródło')),
+                ('last_published_at', models.DateTimeField(verbose_name='Data publikacji ostatniego ogłoszenia')),
+                ('last_tender_id', models.CharField(max_length=100, verbose_name='Identyfikator ostatniego przetargu')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Data ostatniej aktualizacji')),
+            ],
+            options={
+                'verbose_name': 'Kursor scrapera',
+                'verbose_name_plural': 'Kursory scrapera',
+                'db_table': 'scraper_cursors',
+            },
+        ),
+    ]
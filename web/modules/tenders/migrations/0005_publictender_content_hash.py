@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0004_scrapercursor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publictender',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='Skrót treści'),
+        ),
+    ]
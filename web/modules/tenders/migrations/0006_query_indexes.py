@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:52
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_follows(apps, schema_editor):
+    FollowTender = apps.get_model('tenders', 'FollowTender')
+    duplicates = (
+        FollowTender.objects.values('user_id', 'tender_uuid')
+        .annotate(keep_id=Min('id'), count=Count('id'))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        FollowTender.objects.filter(
+            user_id=duplicate['user_id'],
+            tender_uuid=duplicate['tender_uuid'],
+        ).exclude(id=duplicate['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0005_publictender_content_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='followtender',
+            index=models.Index(fields=['user', 'followed_at'], name='follow_tender_user_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='privatetender',
+            index=models.Index(fields=['owner', 'publication_date'], name='private_owner_pub_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='privatetender',
+            index=models.Index(fields=['publication_date', 'uuid'], name='private_pub_date_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publictender',
+            index=models.Index(fields=['publication_date', 'uuid'], name='tenders_pub_date_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publictender',
+            index=models.Index(fields=['submission_deadline'], name='tenders_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publictender',
+            index=models.Index(fields=['created_at'], name='tenders_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tendernote',
+            index=models.Index(fields=['user', 'tender_uuid', 'created_at'], name='notes_user_uuid_created_idx'),
+        ),
+        migrations.RunPython(remove_duplicate_follows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='followtender',
+            constraint=models.UniqueConstraint(fields=('user', 'tender_uuid'), name='follow_tender_user_uuid_uniq'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+MYSQL_FORWARD = [
+    "ALTER TABLE tenders ADD FULLTEXT INDEX tenders_fulltext_idx "
+    "(order_name, description, contracting_authority) WITH PARSER ngram",
+]
+
+MYSQL_REVERSE = [
+    "ALTER TABLE tenders DROP INDEX tenders_fulltext_idx",
+]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE tenders_fts USING fts5("
+    "order_name, description, contracting_authority, "
+    "content='tenders', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER tenders_fts_ai AFTER INSERT ON tenders BEGIN "
+    "INSERT INTO tenders_fts(rowid, order_name, description, contracting_authority) "
+    "VALUES (new.rowid, new.order_name, new.description, new.contracting_authority); END",
+    "CREATE TRIGGER tenders_fts_ad AFTER DELETE ON tenders BEGIN "
+    "INSERT INTO tenders_fts(tenders_fts, rowid, order_name, description, contracting_authority) "
+    "VALUES ('delete', old.rowid, old.order_name, old.description, old.contracting_authority); END",
+    "CREATE TRIGGER tenders_fts_au AFTER UPDATE ON tenders BEGIN "
+    "INSERT INTO tenders_fts(tenders_fts, rowid, order_name, description, contracting_authority) "
+    "VALUES ('delete', old.rowid, old.order_name, old.description, old.contracting_authority); "
+    "INSERT INTO tenders_fts(rowid, order_name, description, contracting_authority) "
+    "VALUES (new.rowid, new.order_name, new.description, new.contracting_authority); END",
+    "INSERT INTO tenders_fts(tenders_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS tenders_fts_au",
+    "DROP TRIGGER IF EXISTS tenders_fts_ad",
+    "DROP TRIGGER IF EXISTS tenders_fts_ai",
+    "DROP TABLE IF EXISTS tenders_fts",
+]
+
+
+def run_statements(schema_editor, statements_by_vendor):
+    for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    run_statements(schema_editor, {'mysql': MYSQL_FORWARD, 'sqlite': SQLITE_FORWARD})
+
+
+def drop_fulltext_index(apps, schema_editor):
+    run_statements(schema_editor, {'mysql': MYSQL_REVERSE, 'sqlite': SQLITE_REVERSE})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0006_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:01
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CPV_CODE_PATTERN = re.compile(r'(?<!\d)(\d{8})(?:-\d)?(?!\d)')
+
+
+def populate_cpv_codes(apps, schema_editor):
+    PublicTender = apps.get_model('tenders', 'PublicTender')
+    TenderCpvCode = apps.get_model('tenders', 'TenderCpvCode')
+
+    batch = []
+    tenders = PublicTender.objects.exclude(cpv_code__isnull=True).values_list('uuid', 'cpv_code')
+    for uuid, cpv_code in tenders.iterator(chunk_size=2000):
+        for code in dict.fromkeys(CPV_CODE_PATTERN.findall(cpv_code)):
+            batch.append(TenderCpvCode(tender_id=uuid, code=code))
+        if len(batch) >= 2000:
+            TenderCpvCode.objects.bulk_create(batch)
+            batch = []
+
+    if batch:
+        TenderCpvCode.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0007_tenders_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenderCpvCode',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=8, verbose_name='Kod CPV')),
+                ('tender', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cpv_codes', to='tenders.publictender', verbose_name='Przetarg')),
+            ],
+            options={
+                'verbose_name': 'Kod CPV przetargu',
+                'verbose_name_plural': 'Kody CPV przetargów',
+                'db_table': 'tender_cpv_codes',
+                'indexes': [models.Index(fields=['code', 'tender'], name='tender_cpv_codes_code_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tender', 'code'), name='tender_cpv_codes_tender_code_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_cpv_codes, migrations.RunPython.noop),
+    ]
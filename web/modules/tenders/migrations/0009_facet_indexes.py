@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0008_tendercpvcode'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publictender',
+            index=models.Index(fields=['authority_region'], name='tenders_region_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publictender',
+            index=models.Index(fields=['order_type'], name='tenders_order_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publictender',
+            index=models.Index(fields=['tender_type'], name='tenders_tender_type_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0009_facet_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenderDailyStat',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('total', 'Wszystkie przetargi'), ('region', 'Region zamawiającego'), ('authority', 'Zamawiający'), ('deadline', 'Termin składania ofert')], max_length=20, verbose_name='Wymiar')),
+                ('day', models.DateField(verbose_name='Dzień')),
+                ('value', models.CharField(blank=True, default='', max_length=255, verbose_name='Wartość')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Liczba przetargów')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Data ostatniej aktualizacji')),
+            ],
+            options={
+                'verbose_name': 'Dzienna statystyka przetargów',
+                'verbose_name_plural': 'Dzienne statystyki przetargów',
+                'db_table': 'tender_daily_stats',
+                'ordering': ['-day', '-count'],
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'day', 'value'), name='tender_daily_stats_uniq')],
+            },
+        ),
+    ]
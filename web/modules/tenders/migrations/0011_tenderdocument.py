@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0010_tenderdailystat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenderDocument',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('details', 'Strona szczegółów ogłoszenia'), ('pdf', 'Dokument PDF')], max_length=10, verbose_name='Rodzaj dokumentu')),
+                ('url', models.URLField(max_length=1024, verbose_name='URL dokumentu')),
+                ('status', models.CharField(choices=[('done', 'Pobrano'), ('failed', 'Błąd')], max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Liczba prób')),
+                ('content_hash', models.CharField(blank=True, max_length=64, null=True, verbose_name='Skrót treści')),
+                ('content_type', models.CharField(blank=True, max_length=100, null=True, verbose_name='Typ treści')),
+                ('size', models.PositiveIntegerField(blank=True, null=True, verbose_name='Rozmiar w bajtach')),
+                ('text', models.TextField(blank=True, null=True, verbose_name='Wyodrębniony tekst')),
+                ('error', models.CharField(blank=True, max_length=255, null=True, verbose_name='Błąd')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Data ostatniej aktualizacji')),
+                ('tender', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='documents', to='tenders.publictender', verbose_name='Przetarg')),
+            ],
+            options={
+                'verbose_name': 'Dokument przetargu',
+                'verbose_name_plural': 'Dokumenty przetargów',
+                'db_table': 'tender_documents',
+                'indexes': [models.Index(fields=['content_hash'], name='tender_documents_hash_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tender', 'kind'), name='tender_documents_tender_kind_uniq')],
+            },
+        ),
+    ]
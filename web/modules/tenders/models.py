@@ -1,7 +1,7 @@
 from django.db import models
 from django.conf import settings
 import uuid
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, Set, Tuple
 
 
 class PublicTender(models.Model):
@@ -195,17 +195,58 @@ class PublicTender(models.Model):
         null=True,
         blank=True
     )
+    content_hash: models.CharField = models.CharField(
+        max_length=64,
+        verbose_name="Skrót treści",
+        null=True,
+        blank=True
+    )
 
     class Meta:
         db_table = 'tenders'
         verbose_name = "Tender"
         verbose_name_plural = "Tenders"
         ordering = ['-publication_date']
+        indexes = [
+            models.Index(fields=['publication_date', 'uuid'], name='tenders_pub_date_uuid_idx'),
+            models.Index(fields=['submission_deadline'], name='tenders_deadline_idx'),
+            models.Index(fields=['created_at'], name='tenders_created_at_idx'),
+            models.Index(fields=['authority_region'], name='tenders_region_idx'),
+            models.Index(fields=['order_type'], name='tenders_order_type_idx'),
+            models.Index(fields=['tender_type'], name='tenders_tender_type_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.announcement_number} - {self.order_name[:50]}"
 
 
+class TenderCpvCode(models.Model):
+    tender: models.ForeignKey = models.ForeignKey(
+        PublicTender,
+        on_delete=models.CASCADE,
+        verbose_name="Przetarg",
+        related_name="cpv_codes"
+    )
+    code: models.CharField = models.CharField(
+        max_length=8,
+        verbose_name="Kod CPV"
+    )
+
+    class Meta:
+        db_table = 'tender_cpv_codes'
+        verbose_name = "Kod CPV przetargu"
+        verbose_name_plural = "Kody CPV przetargów"
+        constraints = [
+            models.UniqueConstraint(fields=['tender', 'code'], name='tender_cpv_codes_tender_code_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['code', 'tender'], name='tender_cpv_codes_code_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.code} ({self.tender_id})"
+
+
 class FollowTender(models.Model):
     TENDER_TYPE_CHOICES: tuple = (
         ('private', 'Prywatny'),
@@ -236,6 +277,12 @@ class FollowTender(models.Model):
         verbose_name = "Obserwacja przetargu"
         verbose_name_plural = "Obserwacje przetargów"
         ordering = ['-followed_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'tender_uuid'], name='follow_tender_user_uuid_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'followed_at'], name='follow_tender_user_at_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user.username} obserwuje {self.tender}"
@@ -243,6 +290,24 @@ class FollowTender(models.Model):
     def save(self, *args: Any, **kwargs: Any) -> None:
         super().save(*args, **kwargs)
 
+
+class PrivateTenderQuerySet(models.QuerySet):
+    def visibility_condition(self, user: Any) -> models.Q:
+        shared = PrivateTender.shared_with.through.objects.filter(
+            privatetender_id=models.OuterRef('pk'),
+            user_id=user.pk
+        )
+        return models.Q(owner_id=user.pk) | models.Exists(shared)
+
+    def visible_to(self, user: Any) -> 'PrivateTenderQuerySet':
+        return self.filter(self.visibility_condition(user))
+
+    def with_visibility(self, user: Any) -> 'PrivateTenderQuerySet':
+        return self.annotate(
+            is_visible=models.ExpressionWrapper(self.visibility_condition(user), output_field=models.BooleanField())
+        )
+
+
 class PrivateTender(models.Model):
     uuid: models.UUIDField = models.UUIDField(
         primary_key=True, 
@@ -303,17 +368,48 @@ class PrivateTender(models.Model):
         blank=True
     )
 
+    objects = PrivateTenderQuerySet.as_manager()
+
     class Meta:
         db_table = 'private_tenders'
         verbose_name = "Przetarg prywatny"
         verbose_name_plural = "Przetargi prywatne"
         ordering = ['-publication_date']
+        indexes = [
+            models.Index(fields=['owner', 'publication_date'], name='private_owner_pub_date_idx'),
+            models.Index(fields=['publication_date', 'uuid'], name='private_pub_date_uuid_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.tender_id} - {self.title[:50]}"
 
-    def save(self, *args: Any, **kwargs: Any) -> None:
-        super().save(*args, **kwargs)
+    def change_shared_with(self, add: Iterable[int] = (), remove: Iterable[int] = ()) -> Tuple[Set[int], Set[int]]:
+        add, remove = set(add), set(remove) - set(add)
+        current = set(
+            PrivateTender.shared_with.through.objects.filter(
+                privatetender_id=self.pk,
+                user_id__in=add | remove
+            ).values_list('user_id', flat=True)
+        )
+        return self.apply_shared_with_diff(add - current, remove & current)
+
+    def replace_shared_with(self, user_ids: Iterable[int]) -> Tuple[Set[int], Set[int]]:
+        target = set(user_ids)
+        current = set(
+            PrivateTender.shared_with.through.objects.filter(privatetender_id=self.pk).values_list('user_id', flat=True)
+        )
+        return self.apply_shared_with_diff(target - current, current - target)
+
+    def apply_shared_with_diff(self, added: Set[int], removed: Set[int]) -> Tuple[Set[int], Set[int]]:
+        through = PrivateTender.shared_with.through
+        if removed:
+            through.objects.filter(privatetender_id=self.pk, user_id__in=removed).delete()
+        if added:
+            through.objects.bulk_create(
+                [through(privatetender_id=self.pk, user_id=user_id) for user_id in added],
+                ignore_conflicts=True
+            )
+        return added, removed
 
 
 class TenderNote(models.Model):
@@ -349,6 +445,9 @@ class TenderNote(models.Model):
         verbose_name = "Notatka do przetargu"
         verbose_name_plural = "Notatki do przetargów"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'tender_uuid', 'created_at'], name='notes_user_uuid_created_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"Notatka użytkownika {self.user.username} do przetargu {self.tender_uuid} ({self.tender_type})"
@@ -358,15 +457,176 @@ class TenderNote(models.Model):
 
     @property
     def tender(self) -> models.Model:
-        if self.tender_type == 'public':
-            try:
-                return PublicTender.objects.get(uuid=self.tender_uuid)
-            except PublicTender.DoesNotExist:
-                raise ValueError(f"Public tender with UUID {self.tender_uuid} does not exist")
-        elif self.tender_type == 'private':
-            try:
-                return PrivateTender.objects.get(uuid=self.tender_uuid)
-            except PrivateTender.DoesNotExist:
-                raise ValueError(f"Private tender with UUID {self.tender_uuid} does not exist")
-        else:
+        from .resolvers import TenderResolver
+
+        if self.tender_type not in ('public', 'private'):
             raise ValueError(f"Invalid tender_type: {self.tender_type}")
+
+        tender = TenderResolver(self.user).get(self.tender_uuid, self.tender_type)
+        if tender is None:
+            raise ValueError(f"{self.tender_type.capitalize()} tender with UUID {self.tender_uuid} does not exist")
+        return tender
+
+class ScraperCursor(models.Model):
+    source: models.CharField = models.CharField(
+        max_length=50,
+        unique=True,
+        verbose_name="Źródło"
+    )
+    last_published_at: models.DateTimeField = models.DateTimeField(
+        verbose_name="Data publikacji ostatniego ogłoszenia"
+    )
+    last_tender_id: models.CharField = models.CharField(
+        max_length=100,
+        verbose_name="Identyfikator ostatniego przetargu"
+    )
+    updated_at: models.DateTimeField = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Data ostatniej aktualizacji"
+    )
+
+    class Meta:
+        db_table = 'scraper_cursors'
+        verbose_name = "Kursor scrapera"
+        verbose_name_plural = "Kursory scrapera"
+
+    def __str__(self) -> str:
+        return f"{self.source}: {self.last_published_at} ({self.last_tender_id})"
+
+
+class TenderDailyStat(models.Model):
+    DIMENSION_TOTAL = 'total'
+    DIMENSION_REGION = 'region'
+    DIMENSION_AUTHORITY = 'authority'
+    DIMENSION_DEADLINE = 'deadline'
+
+    DIMENSION_CHOICES: tuple = (
+        (DIMENSION_TOTAL, 'Wszystkie przetargi'),
+        (DIMENSION_REGION, 'Region zamawiającego'),
+        (DIMENSION_AUTHORITY, 'Zamawiający'),
+        (DIMENSION_DEADLINE, 'Termin składania ofert'),
+    )
+
+    dimension: models.CharField = models.CharField(
+        max_length=20,
+        choices=DIMENSION_CHOICES,
+        verbose_name="Wymiar"
+    )
+    day: models.DateField = models.DateField(
+        verbose_name="Dzień"
+    )
+    value: models.CharField = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        verbose_name="Wartość"
+    )
+    count: models.PositiveIntegerField = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Liczba przetargów"
+    )
+    updated_at: models.DateTimeField = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Data ostatniej aktualizacji"
+    )
+
+    class Meta:
+        db_table = 'tender_daily_stats'
+        verbose_name = "Dzienna statystyka przetargów"
+        verbose_name_plural = "Dzienne statystyki przetargów"
+        ordering = ['-day', '-count']
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'day', 'value'], name='tender_daily_stats_uniq'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.dimension} {self.day} {self.value}: {self.count}"
+
+
+class TenderDocument(models.Model):
+    KIND_DETAILS = 'details'
+    KIND_PDF = 'pdf'
+
+    KIND_CHOICES: tuple = (
+        (KIND_DETAILS, 'Strona szczegółów ogłoszenia'),
+        (KIND_PDF, 'Dokument PDF'),
+    )
+
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES: tuple = (
+        (STATUS_DONE, 'Pobrano'),
+        (STATUS_FAILED, 'Błąd'),
+    )
+
+    tender: models.ForeignKey = models.ForeignKey(
+        PublicTender,
+        on_delete=models.CASCADE,
+        verbose_name="Przetarg",
+        related_name="documents"
+    )
+    kind: models.CharField = models.CharField(
+        max_length=10,
+        choices=KIND_CHOICES,
+        verbose_name="Rodzaj dokumentu"
+    )
+    url: models.URLField = models.URLField(
+        max_length=1024,
+        verbose_name="URL dokumentu"
+    )
+    status: models.CharField = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        verbose_name="Status"
+    )
+    attempts: models.PositiveSmallIntegerField = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Liczba prób"
+    )
+    content_hash: models.CharField = models.CharField(
+        max_length=64,
+        verbose_name="Skrót treści",
+        null=True,
+        blank=True
+    )
+    content_type: models.CharField = models.CharField(
+        max_length=100,
+        verbose_name="Typ treści",
+        null=True,
+        blank=True
+    )
+    size: models.PositiveIntegerField = models.PositiveIntegerField(
+        verbose_name="Rozmiar w bajtach",
+        null=True,
+        blank=True
+    )
+    text: models.TextField = models.TextField(
+        verbose_name="Wyodrębniony tekst",
+        null=True,
+        blank=True
+    )
+    error: models.CharField = models.CharField(
+        max_length=255,
+        verbose_name="Błąd",
+        null=True,
+        blank=True
+    )
+    updated_at: models.DateTimeField = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Data ostatniej aktualizacji"
+    )
+
+    class Meta:
+        db_table = 'tender_documents'
+        verbose_name = "Dokument przetargu"
+        verbose_name_plural = "Dokumenty przetargów"
+        constraints = [
+            models.UniqueConstraint(fields=['tender', 'kind'], name='tender_documents_tender_kind_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['content_hash'], name='tender_documents_hash_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} {self.tender_id} ({self.status})"
@@ -0,0 +1,213 @@
+import base64
+import binascii
+import json
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CappedPageNumberPagination(PageNumberPagination):
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class KeysetPagination(BasePagination):
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    keyset_field = 'publication_date'
+    tiebreaker_field = 'uuid'
+    invalid_cursor_message = "Nieprawidłowy kursor."
+
+    def __init__(self, keyset_field: Optional[str] = None, tiebreaker_field: Optional[str] = None) -> None:
+        self.fallback: Optional[PageNumberPagination] = None
+        if keyset_field is not None:
+            self.keyset_field = keyset_field
+        if tiebreaker_field is not None:
+            self.tiebreaker_field = tiebreaker_field
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def include_count(self, request: Request) -> bool:
+        return request.query_params.get(self.count_query_param, 'true').lower() not in ('0', 'false', 'no')
+
+    def get_keyset_direction(self, queryset: QuerySet) -> Optional[bool]:
+        ordering: Sequence[str] = queryset.query.order_by or queryset.model._meta.ordering
+        if not ordering:
+            return True
+        if ordering[0].lstrip('-') != self.keyset_field or any(
+            field.lstrip('-') not in (self.keyset_field, self.tiebreaker_field) for field in ordering
+        ):
+            return None
+        return ordering[0].startswith('-')
+
+    def encode_cursor(self, instance: Any, reverse: bool) -> str:
+        key = getattr(instance, self.keyset_field)
+        payload = {
+            'k': key.isoformat() if hasattr(key, 'isoformat') else key,
+            'u': str(getattr(instance, self.tiebreaker_field)),
+            'r': reverse,
+        }
+        token = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('ascii'))
+        return token.decode('ascii')
+
+    def decode_cursor(self, request: Request, model: Type[Model]) -> Optional[Tuple[Any, Any, bool]]:
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            key = model._meta.get_field(self.keyset_field).to_python(payload['k'])
+            tiebreaker = model._meta.get_field(self.tiebreaker_field).to_python(payload['u'])
+            return key, tiebreaker, bool(payload['r'])
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def sort_key(self, instance: Any) -> Tuple[Any, Any]:
+        tiebreaker = getattr(instance, self.tiebreaker_field)
+        return getattr(instance, self.keyset_field), tiebreaker.hex if isinstance(tiebreaker, uuid.UUID) else tiebreaker
+
+    def keyset_queryset(self, queryset: QuerySet, cursor: Optional[Tuple[Any, Any, bool]], scan_descending: bool) -> QuerySet:
+        if cursor:
+            key, tiebreaker, _ = cursor
+            suffix = 'lt' if scan_descending else 'gt'
+            bound = 'lte' if scan_descending else 'gte'
+            queryset = queryset.filter(
+                Q(**{f"{self.keyset_field}__{bound}": key}) & (
+                    Q(**{f"{self.keyset_field}__{suffix}": key}) |
+                    Q(**{self.keyset_field: key, f"{self.tiebreaker_field}__{suffix}": tiebreaker})
+                )
+            )
+
+        prefix = '-' if scan_descending else ''
+        return queryset.order_by(f"{prefix}{self.keyset_field}", f"{prefix}{self.tiebreaker_field}")
+
+    def scan(self, queryset: QuerySet, cursor: Optional[Tuple[Any, Any, bool]], scan_descending: bool) -> List[Any]:
+        return list(self.keyset_queryset(queryset, cursor, scan_descending)[:self.page_size + 1])
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> Optional[List[Any]]:
+        descending = self.get_keyset_direction(queryset)
+        if descending is None:
+            self.fallback = CappedPageNumberPagination()
+            return self.fallback.paginate_queryset(queryset, request, view)
+
+        return self.paginate_querysets([queryset], request, descending)
+
+    def paginate_querysets(self, querysets: List[QuerySet], request: Request, descending: bool = True) -> List[Any]:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.count: Optional[int] = None
+
+        if self.include_count(request):
+            self.count = sum(queryset.count() for queryset in querysets)
+
+        cursor = self.decode_cursor(request, querysets[0].model)
+        reverse = cursor[2] if cursor else False
+        scan_descending = descending != reverse
+
+        results: List[Any] = []
+        for queryset in querysets:
+            results.extend(self.scan(queryset, cursor, scan_descending))
+        if len(querysets) > 1:
+            results.sort(key=self.sort_key, reverse=scan_descending)
+
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        return self.page
+
+    def build_link(self, cursor: str) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.build_link(self.encode_cursor(self.page[-1], reverse=False))
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self.build_link(self.encode_cursor(self.page[0], reverse=True))
+
+    def get_paginated_response(self, data: List[Dict[str, Any]]) -> Response:
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+
+        payload: Dict[str, Any] = {}
+        if self.count is not None:
+            payload['count'] = self.count
+        payload['next'] = self.get_next_link()
+        payload['previous'] = self.get_previous_link()
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'example': 123},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: Any) -> List[Dict[str, Any]]:
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "Kursor stronicowania.",
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f"Liczba wyników na stronie (maks. {self.max_page_size}).",
+                'schema': {'type': 'integer'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "Ustaw na false, aby pominąć liczenie wszystkich wyników.",
+                'schema': {'type': 'boolean'},
+            },
+            {
+                'name': 'page',
+                'required': False,
+                'in': 'query',
+                'description': "Numer strony (tylko przy sortowaniu innym niż po dacie publikacji lub wyszukiwaniu).",
+                'schema': {'type': 'integer'},
+            },
+        ]
@@ -0,0 +1,126 @@
+import uuid
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
+from django.core.cache import cache
+from django.db import models
+
+from .models import PublicTender, PrivateTender
+
+TENDER_TYPE_CACHE_KEY = 'tenders:type:{}'
+TENDER_TYPE_CACHE_TIMEOUT = 24 * 60 * 60
+
+ACCESS_GRANTED = 'ok'
+ACCESS_NOT_FOUND = 'not_found'
+ACCESS_FORBIDDEN = 'forbidden'
+
+TENDER_MODELS: Dict[str, type] = {
+    'public': PublicTender,
+    'private': PrivateTender,
+}
+
+
+class TenderResolver:
+    def __init__(self, user: Any = None) -> None:
+        self.user = user
+        self.tenders: Dict[Tuple[uuid.UUID, Optional[str]], Optional[models.Model]] = {}
+        self.access: Dict[uuid.UUID, bool] = {}
+
+    @staticmethod
+    def normalize_uuid(tender_uuid: Union[str, uuid.UUID]) -> Optional[uuid.UUID]:
+        if isinstance(tender_uuid, uuid.UUID):
+            return tender_uuid
+        try:
+            return uuid.UUID(str(tender_uuid))
+        except ValueError:
+            return None
+
+    def probe_order(self, tender_uuid: uuid.UUID, tender_type: Optional[str]) -> Tuple[str, ...]:
+        if tender_type is not None:
+            return (tender_type,) if tender_type in TENDER_MODELS else ()
+
+        cached_type = cache.get(TENDER_TYPE_CACHE_KEY.format(tender_uuid.hex))
+        if cached_type == 'private':
+            return 'private', 'public'
+        return 'public', 'private'
+
+    def get(self, tender_uuid: Union[str, uuid.UUID], tender_type: Optional[str] = None) -> Optional[models.Model]:
+        normalized_uuid = self.normalize_uuid(tender_uuid)
+        if normalized_uuid is None:
+            return None
+
+        key = (normalized_uuid, tender_type)
+        if key in self.tenders:
+            return self.tenders[key]
+
+        tender = None
+        for candidate_type in self.probe_order(normalized_uuid, tender_type):
+            queryset = TENDER_MODELS[candidate_type].objects.filter(uuid=normalized_uuid)
+            if candidate_type == 'private' and self.user is not None and self.user.is_authenticated:
+                queryset = queryset.with_visibility(self.user)
+
+            tender = queryset.first()
+            if tender is not None:
+                if hasattr(tender, 'is_visible'):
+                    self.access[tender.uuid] = tender.is_visible
+                cache.set(TENDER_TYPE_CACHE_KEY.format(normalized_uuid.hex), candidate_type, TENDER_TYPE_CACHE_TIMEOUT)
+                self.tenders[(normalized_uuid, candidate_type)] = tender
+                break
+
+        self.tenders[key] = tender
+        return tender
+
+    def has_access(self, tender: models.Model) -> bool:
+        if isinstance(tender, PublicTender):
+            return True
+        if self.user is None or not self.user.is_authenticated:
+            return False
+
+        if tender.uuid not in self.access:
+            self.access[tender.uuid] = (
+                tender.owner_id == self.user.pk or
+                PrivateTender.objects.visible_to(self.user).filter(pk=tender.pk).exists()
+            )
+        return self.access[tender.uuid]
+
+    def get_accessible(self, tender_uuid: Union[str, uuid.UUID], tender_type: Optional[str] = None) -> Optional[models.Model]:
+        tender = self.get(tender_uuid, tender_type)
+        if tender is None or not self.has_access(tender):
+            return None
+        return tender
+
+    def check_access_many(self, references: Iterable[Tuple[uuid.UUID, str]]) -> Dict[Tuple[uuid.UUID, str], str]:
+        references = list(references)
+        public_uuids = {tender_uuid for tender_uuid, tender_type in references if tender_type == 'public'}
+        private_uuids = {tender_uuid for tender_uuid, tender_type in references if tender_type == 'private'}
+
+        found_public: Set[uuid.UUID] = set()
+        if public_uuids:
+            found_public = set(PublicTender.objects.filter(uuid__in=public_uuids).values_list('uuid', flat=True))
+
+        private_visibility: Dict[uuid.UUID, bool] = {}
+        if private_uuids:
+            private_visibility = dict(
+                PrivateTender.objects.filter(uuid__in=private_uuids)
+                .with_visibility(self.user)
+                .values_list('uuid', 'is_visible')
+            )
+
+        statuses: Dict[Tuple[uuid.UUID, str], str] = {}
+        for tender_uuid, tender_type in references:
+            if tender_type == 'public':
+                status = ACCESS_GRANTED if tender_uuid in found_public else ACCESS_NOT_FOUND
+            elif tender_uuid not in private_visibility:
+                status = ACCESS_NOT_FOUND
+            elif private_visibility[tender_uuid]:
+                status = ACCESS_GRANTED
+            else:
+                status = ACCESS_FORBIDDEN
+            statuses[(tender_uuid, tender_type)] = status
+        return statuses
+
+
+def get_tender_resolver(request: Any) -> TenderResolver:
+    resolver = getattr(request, '_tender_resolver', None)
+    if resolver is None:
+        resolver = TenderResolver(request.user)
+        request._tender_resolver = resolver
+    return resolver
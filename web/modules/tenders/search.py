@@ -0,0 +1,101 @@
+from typing import Any, Dict, List, Optional, Sequence, Type
+from django.conf import settings
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+from rest_framework.request import Request
+
+SEARCH_RANK = 'search_rank'
+
+
+class SearchBackend:
+    def __init__(self, connection: Any) -> None:
+        self.connection = connection
+
+    def qualified_columns(self, queryset: QuerySet, fields: Sequence[str]) -> List[str]:
+        quote = self.connection.ops.quote_name
+        table = quote(queryset.model._meta.db_table)
+        return [f"{table}.{quote(queryset.model._meta.get_field(field).column)}" for field in fields]
+
+    def search(self, queryset: QuerySet, fields: Sequence[str], terms: List[str]) -> QuerySet:
+        raise NotImplementedError
+
+
+class LikeSearchBackend(SearchBackend):
+    def search(self, queryset: QuerySet, fields: Sequence[str], terms: List[str]) -> QuerySet:
+        for term in terms:
+            condition = Q()
+            for field in fields:
+                condition |= Q(**{f"{field}__icontains": term})
+            queryset = queryset.filter(condition)
+        return queryset
+
+
+class MySQLFullTextSearchBackend(SearchBackend):
+    def search(self, queryset: QuerySet, fields: Sequence[str], terms: List[str]) -> QuerySet:
+        # W trybie naturalnym parser ngram łączy bigramy słowa przez OR, więc "drogi" pasowałoby prawie do każdego
+        # wiersza. Każde słowo jako wymagana fraza (+"...") daje dopasowanie frazy i AND, jak w FTS5 i SearchFilter.
+        phrases = [term.replace('"', ' ').strip() for term in terms]
+        query = ' '.join(f'+"{phrase}"' for phrase in phrases if phrase)
+        if not query:
+            return queryset
+
+        match = f"MATCH({', '.join(self.qualified_columns(queryset, fields))}) AGAINST (%s IN BOOLEAN MODE)"
+
+        return queryset.filter(
+            RawSQL(match, [query], output_field=BooleanField())
+        ).annotate(**{SEARCH_RANK: RawSQL(match, [query], output_field=FloatField())})
+
+
+class SQLiteFTS5SearchBackend(SearchBackend):
+    def search(self, queryset: QuerySet, fields: Sequence[str], terms: List[str]) -> QuerySet:
+        quote = self.connection.ops.quote_name
+        table = queryset.model._meta.db_table
+        fts_table = quote(f"{table}_fts")
+        query = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+        matches = f"{quote(table)}.rowid IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s)"
+        rank = (
+            f"(SELECT -bm25({fts_table}) FROM {fts_table} "
+            f"WHERE {fts_table} MATCH %s AND {fts_table}.rowid = {quote(table)}.rowid)"
+        )
+
+        return queryset.filter(
+            RawSQL(matches, [query], output_field=BooleanField())
+        ).annotate(**{SEARCH_RANK: RawSQL(rank, [query], output_field=FloatField())})
+
+
+SEARCH_BACKENDS: Dict[str, Type[SearchBackend]] = {
+    'mysql': MySQLFullTextSearchBackend,
+    'sqlite': SQLiteFTS5SearchBackend,
+}
+
+
+def get_search_backend(using: str = 'default') -> SearchBackend:
+    connection = connections[using]
+    backend_name: Optional[str] = getattr(settings, 'TENDERS_SEARCH_BACKEND', None)
+
+    if backend_name == 'like':
+        return LikeSearchBackend(connection)
+
+    backend_class = SEARCH_BACKENDS.get(backend_name or connection.vendor, LikeSearchBackend)
+    return backend_class(connection)
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    def filter_queryset(self, request: Request, queryset: QuerySet, view: Any) -> QuerySet:
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        return get_search_backend(queryset.db).search(queryset, search_fields, search_terms)
+
+
+class RelevanceOrderingFilter(filters.OrderingFilter):
+    def get_ordering(self, request: Request, queryset: QuerySet, view: Any) -> Optional[List[str]]:
+        if not request.query_params.get(self.ordering_param) and SEARCH_RANK in queryset.query.annotations:
+            return [f"-{SEARCH_RANK}", *(self.get_default_ordering(view) or [])]
+        return super().get_ordering(request, queryset, view)
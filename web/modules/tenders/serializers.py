@@ -1,14 +1,55 @@
 from rest_framework import serializers
 from typing import Dict, Any, List
 from django.contrib.auth import get_user_model
-from .models import PublicTender, FollowTender, PrivateTender, TenderNote
+from .models import PublicTender, FollowTender, PrivateTender, TenderNote, TenderDailyStat
+from .resolvers import get_tender_resolver
 
 User = get_user_model()
 
-class PublicTenderSerializer(serializers.ModelSerializer):
+
+def validate_tender_access(request: Any, tender_uuid: Any, tender_type: str, forbidden_message: str) -> None:
+    if tender_type not in ('public', 'private'):
+        raise serializers.ValidationError("Nieprawidłowy typ przetargu.")
+
+    resolver = get_tender_resolver(request)
+    tender = resolver.get(tender_uuid, tender_type)
+    if tender is None:
+        raise serializers.ValidationError("Przetarg o podanym UUID nie istnieje.")
+    if not resolver.has_access(tender):
+        raise serializers.ValidationError(forbidden_message)
+
+
+PUBLIC_TENDER_HEAVY_FIELDS = ('html_body', 'contractors')
+
+PUBLIC_TENDER_INTERNAL_FIELDS = ('content_hash',)
+
+PUBLIC_TENDER_SUMMARY_FIELDS = [
+    field.name for field in PublicTender._meta.concrete_fields
+    if field.name not in (*PUBLIC_TENDER_HEAVY_FIELDS, *PUBLIC_TENDER_INTERNAL_FIELDS)
+]
+
+
+class SparseFieldsetMixin:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        requested_fields = self.context.get('fields')
+        if requested_fields:
+            for field_name in set(self.fields) - set(requested_fields):
+                self.fields.pop(field_name)
+
+
+class PublicTenderSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = PublicTender
-        fields = '__all__'
+        exclude = PUBLIC_TENDER_INTERNAL_FIELDS
+        read_only_fields = ['uuid']
+
+
+class PublicTenderListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    class Meta:
+        model = PublicTender
+        fields = PUBLIC_TENDER_SUMMARY_FIELDS
         read_only_fields = ['uuid']
 
 class PrivateTenderSerializer(serializers.ModelSerializer):
@@ -47,9 +88,8 @@ class PrivateTenderSerializer(serializers.ModelSerializer):
         instance = super().update(instance, validated_data)
 
         if shared_with_usernames is not None:
-            instance.shared_with.clear()
-            users_to_share_with = User.objects.filter(username__in=shared_with_usernames)
-            instance.shared_with.add(*users_to_share_with)
+            user_ids = User.objects.filter(username__in=shared_with_usernames).values_list('id', flat=True)
+            instance.replace_shared_with(user_ids)
 
         return instance
 
@@ -61,24 +101,12 @@ class TenderNoteSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'user']
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
-        tender_uuid = attrs.get('tender_uuid')
-        tender_type = attrs.get('tender_type')
-        user = self.context['request'].user
-
-        try:
-            if tender_type == 'public':
-                tender = PublicTender.objects.get(uuid=tender_uuid)
-            elif tender_type == 'private':
-                tender = PrivateTender.objects.get(uuid=tender_uuid)
-                if tender.owner != user and user not in tender.shared_with.all():
-                    raise serializers.ValidationError(
-                        "Nie masz uprawnień do dodawania notatek do tego przetargu prywatnego."
-                    )
-            else:
-                raise serializers.ValidationError("Nieprawidłowy typ przetargu.")
-        except (PublicTender.DoesNotExist, PrivateTender.DoesNotExist):
-            raise serializers.ValidationError("Przetarg o podanym UUID nie istnieje.")
-
+        validate_tender_access(
+            self.context['request'],
+            attrs.get('tender_uuid'),
+            attrs.get('tender_type'),
+            "Nie masz uprawnień do dodawania notatek do tego przetargu prywatnego."
+        )
         return attrs
 
     def create(self, validated_data: Dict[str, Any]) -> TenderNote:
@@ -93,29 +121,66 @@ class FollowTenderSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         tender_uuid = attrs.get('tender_uuid')
-        tender_type = attrs.get('tender_type')
         user = self.context['request'].user
 
-        try:
-            if tender_type == 'public':
-                tender = PublicTender.objects.get(uuid=tender_uuid)
-            elif tender_type == 'private':
-                tender = PrivateTender.objects.get(uuid=tender_uuid)
-                if tender.owner != user and user not in tender.shared_with.all():
-                    raise serializers.ValidationError(
-                        "Nie masz uprawnień do dodawania notatek do tego przetargu prywatnego."
-                    )
-            else:
-                raise serializers.ValidationError("Nieprawidłowy typ przetargu.")
+        validate_tender_access(
+            self.context['request'],
+            tender_uuid,
+            attrs.get('tender_type'),
+            "Nie masz uprawnień do dodawania notatek do tego przetargu prywatnego."
+        )
 
-            if FollowTender.objects.filter(user=user, tender_uuid=tender_uuid).exists():
-                raise serializers.ValidationError("Obserwujesz już ten przetarg.")
-
-        except (PublicTender.DoesNotExist, PrivateTender.DoesNotExist):
-            raise serializers.ValidationError("Przetarg o podanym UUID nie istnieje.")
+        if FollowTender.objects.filter(user=user, tender_uuid=tender_uuid).exists():
+            raise serializers.ValidationError("Obserwujesz już ten przetarg.")
 
         return attrs
 
     def create(self, validated_data: Dict[str, Any]) -> FollowTender:
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
+
+
+BULK_MAX_ITEMS = 1000
+
+
+class TenderReferenceSerializer(serializers.Serializer):
+    tender_uuid = serializers.UUIDField()
+    tender_type = serializers.ChoiceField(choices=FollowTender.TENDER_TYPE_CHOICES)
+
+
+class BulkTenderReferenceSerializer(serializers.Serializer):
+    tenders = TenderReferenceSerializer(many=True, allow_empty=False, max_length=BULK_MAX_ITEMS)
+
+
+class BulkTenderNoteItemSerializer(TenderReferenceSerializer):
+    note = serializers.CharField()
+
+
+class BulkTenderNoteSerializer(serializers.Serializer):
+    notes = BulkTenderNoteItemSerializer(many=True, allow_empty=False, max_length=BULK_MAX_ITEMS)
+
+
+class BulkTenderNoteDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=BULK_MAX_ITEMS)
+
+
+class PrivateTenderSharingSerializer(serializers.Serializer):
+    add = serializers.ListField(child=serializers.CharField(), required=False, default=list)
+    remove = serializers.ListField(child=serializers.CharField(), required=False, default=list)
+
+
+class TenderDailyStatSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TenderDailyStat
+        fields = ['dimension', 'day', 'value', 'count']
+
+
+class TenderStatsQuerySerializer(serializers.Serializer):
+    dimension = serializers.ChoiceField(choices=TenderDailyStat.DIMENSION_CHOICES, default=TenderDailyStat.DIMENSION_TOTAL)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    value = serializers.CharField(required=False)
+
+
+class UpcomingDeadlinesQuerySerializer(serializers.Serializer):
+    days = serializers.IntegerField(min_value=1, max_value=365, default=30)
@@ -0,0 +1,107 @@
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from django.db import transaction
+from django.db.models import Count
+from .models import PublicTender, TenderDailyStat
+
+STAT_VALUE_MAX_LENGTH = TenderDailyStat._meta.get_field('value').max_length
+
+PUBLICATION_DIMENSIONS: Dict[str, Optional[str]] = {
+    TenderDailyStat.DIMENSION_TOTAL: None,
+    TenderDailyStat.DIMENSION_REGION: 'authority_region',
+    TenderDailyStat.DIMENSION_AUTHORITY: 'contracting_authority',
+}
+
+
+class StatDays:
+    def __init__(self, publication: Iterable[Optional[date]] = (), deadline: Iterable[Optional[date]] = ()) -> None:
+        self.publication: Set[date] = set(filter(None, publication))
+        self.deadline: Set[date] = set(filter(None, deadline))
+
+    def __bool__(self) -> bool:
+        return bool(self.publication or self.deadline)
+
+    def add(self, publication_day: Optional[date], deadline_day: Optional[date]) -> None:
+        if publication_day:
+            self.publication.add(publication_day)
+        if deadline_day:
+            self.deadline.add(deadline_day)
+
+    def update(self, other: 'StatDays') -> None:
+        self.publication |= other.publication
+        self.deadline |= other.deadline
+
+    def as_dict(self) -> Dict[str, List[str]]:
+        return {
+            'publication': [day.isoformat() for day in sorted(self.publication)],
+            'deadline': [day.isoformat() for day in sorted(self.deadline)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'StatDays':
+        data = data or {}
+        return cls(
+            (date.fromisoformat(day) for day in data.get('publication', ())),
+            (date.fromisoformat(day) for day in data.get('deadline', ()))
+        )
+
+
+def count_by_day(day_field: str, days: List[date], value_field: Optional[str]) -> Counter:
+    group_by = [day_field] + ([value_field] if value_field else [])
+    rows = (
+        PublicTender.objects.filter(**{f"{day_field}__in": days})
+        .order_by()
+        .values_list(*group_by)
+        .annotate(count=Count('pk'))
+    )
+
+    counts: Counter = Counter()
+    for row in rows:
+        value = (row[1] or '')[:STAT_VALUE_MAX_LENGTH] if value_field else ''
+        counts[(row[0], value)] += row[-1]
+    return counts
+
+
+def replace_stats(dimension: str, days: List[date], counts: Counter) -> None:
+    TenderDailyStat.objects.filter(dimension=dimension, day__in=days).delete()
+    TenderDailyStat.objects.bulk_create([
+        TenderDailyStat(dimension=dimension, day=day, value=value, count=count)
+        for (day, value), count in counts.items()
+    ])
+
+
+@transaction.atomic
+def refresh_daily_stats(publication_days: Iterable[date], deadline_days: Iterable[date]) -> None:
+    publication_days = sorted(set(filter(None, publication_days)))
+    deadline_days = sorted(set(filter(None, deadline_days)))
+
+    if publication_days:
+        for dimension, value_field in PUBLICATION_DIMENSIONS.items():
+            replace_stats(dimension, publication_days, count_by_day('publication_date', publication_days, value_field))
+
+    if deadline_days:
+        replace_stats(
+            TenderDailyStat.DIMENSION_DEADLINE,
+            deadline_days,
+            count_by_day('submission_deadline', deadline_days, None)
+        )
+
+
+def rebuild_daily_stats(batch_days: int = 31) -> Tuple[int, int]:
+    publication_days = list(
+        PublicTender.objects.order_by('publication_date').values_list('publication_date', flat=True).distinct()
+    )
+    deadline_days = list(
+        PublicTender.objects.exclude(submission_deadline__isnull=True)
+        .order_by('submission_deadline').values_list('submission_deadline', flat=True).distinct()
+    )
+
+    TenderDailyStat.objects.all().delete()
+    for start in range(0, max(len(publication_days), len(deadline_days)), batch_days):
+        refresh_daily_stats(
+            publication_days[start:start + batch_days],
+            deadline_days[start:start + batch_days]
+        )
+
+    return len(publication_days), len(deadline_days)
@@ -1,50 +1,79 @@
+from datetime import timedelta
 from typing import Any, Dict, List, Optional, Type, Union
 from rest_framework import viewsets, status, filters, mixins
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
+from django.http import Http404
 from django.db.models import Q
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework.viewsets import GenericViewSet
+from rest_framework.exceptions import PermissionDenied
+from django.contrib.auth import get_user_model
 
-from .models import PublicTender, FollowTender, PrivateTender, TenderNote
+from .models import PublicTender, FollowTender, PrivateTender, TenderNote, TenderDailyStat
+from .caching import PublicResponseCacheMixin, ConditionalGetMixin, queryset_validators, instance_validators
+from .pagination import KeysetPagination
+from .resolvers import get_tender_resolver, ACCESS_GRANTED
+from .facets import tender_facets
+from .filters import CpvFilter
+from .search import FullTextSearchFilter, RelevanceOrderingFilter
 from .serializers import (
+    PUBLIC_TENDER_HEAVY_FIELDS,
+    PUBLIC_TENDER_INTERNAL_FIELDS,
+    PUBLIC_TENDER_SUMMARY_FIELDS,
     PublicTenderSerializer,
+    PublicTenderListSerializer,
     FollowTenderSerializer,
     PrivateTenderSerializer,
-    TenderNoteSerializer
+    TenderNoteSerializer,
+    BulkTenderReferenceSerializer,
+    BulkTenderNoteSerializer,
+    BulkTenderNoteDeleteSerializer,
+    PrivateTenderSharingSerializer,
+    TenderDailyStatSerializer,
+    TenderStatsQuerySerializer,
+    UpcomingDeadlinesQuerySerializer
 )
 
-class TenderViewSet(viewsets.ReadOnlyModelViewSet):
+class TenderViewSet(PublicResponseCacheMixin, ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [CpvFilter, FullTextSearchFilter, RelevanceOrderingFilter]
+    pagination_class = KeysetPagination
     search_fields = ['order_name', 'description', 'contracting_authority']
     ordering_fields = ['publication_date', 'submission_deadline', 'created_at']
     ordering = ['-publication_date']
     http_method_names = ['get', 'post', 'patch', 'delete']
     lookup_field = 'uuid'
+    fields_query_param = 'fields'
+
+    def get_requested_fields(self) -> List[str]:
+        requested = self.request.query_params.get(self.fields_query_param, '')
+        available = {field.name for field in PublicTender._meta.concrete_fields} - set(PUBLIC_TENDER_INTERNAL_FIELDS)
+        return [field for field in (name.strip() for name in requested.split(',')) if field in available]
 
     def get_queryset(self):
         public_tenders = PublicTender.objects.all()
-        return public_tenders
 
-    def get_object(self) -> Union[PublicTender, PrivateTender]:
-        uuid = self.kwargs['uuid']
-        user = self.request.user
+        if self.action == 'list':
+            columns = self.get_requested_fields() or PUBLIC_TENDER_SUMMARY_FIELDS
+            public_tenders = public_tenders.only('uuid', 'publication_date', *columns)
+
+        return public_tenders
 
-        try:
-            return PublicTender.objects.get(uuid=uuid)
-        except PublicTender.DoesNotExist:
-            pass
+    def get_serializer_context(self) -> Dict[str, Any]:
+        context = super().get_serializer_context()
+        if self.action in ('list', 'retrieve'):
+            context['fields'] = self.get_requested_fields()
+        return context
 
-        try:
-            return PrivateTender.objects.get(
-                Q(uuid=uuid) & (Q(owner=user) | Q(shared_with=user))
-            )
-        except PrivateTender.DoesNotExist:
-            from django.http import Http404
+    def get_object(self) -> Union[PublicTender, PrivateTender]:
+        tender = get_tender_resolver(self.request).get_accessible(self.kwargs['uuid'])
+        if tender is None:
             raise Http404("Tender not found or you don't have access to it.")
+        return tender
 
     def get_serializer_class(self) -> Type[Union[PublicTenderSerializer, PrivateTenderSerializer]]:
         if self.action == 'retrieve':
@@ -53,35 +82,107 @@ class TenderViewSet(viewsets.ReadOnlyModelViewSet):
                 return PublicTenderSerializer
             else:
                 return PrivateTenderSerializer
+        if self.action == 'list':
+            if set(self.get_requested_fields()) & set(PUBLIC_TENDER_HEAVY_FIELDS):
+                return PublicTenderSerializer
+            return PublicTenderListSerializer
         return PublicTenderSerializer
 
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return self.cached_public_response(
+            request,
+            lambda: super(TenderViewSet, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return self.cached_public_response(
+            request,
+            lambda: super(TenderViewSet, self).retrieve(request, *args, **kwargs),
+            is_public=lambda: isinstance(self.get_object(), PublicTender)
+        )
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request: Request) -> Response:
+        today = timezone.localdate()
+        return self.cached_public_response(
+            request,
+            lambda: Response(tender_facets(self.filter_queryset(PublicTender.objects.all()), today)),
+            extra_key=today.isoformat()
+        )
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='ordering',
+                description='followed_at, -followed_at, publication_date lub -publication_date',
+                required=False,
+                type=str
+            )
+        ]
+    )
     @action(detail=False, methods=['get'])
     def observed(self, request: Request) -> Response:
         user = request.user
 
-        followed_tender_uuids = FollowTender.objects.filter(user=user,).values_list('tender_uuid', flat=True)
+        follows = FollowTender.objects.filter(user=user,)
+        public_tenders = PublicTender.objects.filter(
+            uuid__in=follows.filter(tender_type='public').values('tender_uuid')
+        ).only('uuid', *PUBLIC_TENDER_SUMMARY_FIELDS)
+        private_tenders = PrivateTender.objects.visible_to(user).filter(
+            uuid__in=follows.filter(tender_type='private').values('tender_uuid')
+        )
 
-        public_tenders = PublicTender.objects.filter(uuid__in=followed_tender_uuids)
-        private_tenders = PrivateTender.objects.filter(uuid__in=followed_tender_uuids)
+        validators = queryset_validators(request, [
+            (follows, 'followed_at'),
+            (public_tenders, 'updated_at'),
+            (private_tenders, 'updated_at'),
+        ])
+        return self.conditional_response(
+            request,
+            validators,
+            lambda: self.render_observed(request, follows, public_tenders, private_tenders)
+        )
 
-        public_serializer = PublicTenderSerializer(public_tenders, many=True)
-        private_serializer = PrivateTenderSerializer(private_tenders, many=True)
+    def render_observed(
+        self,
+        request: Request,
+        follows: Any,
+        public_tenders: Any,
+        private_tenders: Any
+    ) -> Response:
+        ordering = request.query_params.get('ordering', '-followed_at')
+        descending = ordering.startswith('-')
 
-        public_data = public_serializer.data
-        private_data = private_serializer.data
+        if ordering.lstrip('-') == 'publication_date':
+            paginator = KeysetPagination()
+            tenders = paginator.paginate_querysets([public_tenders, private_tenders], request, descending)
+        else:
+            paginator = KeysetPagination(keyset_field='followed_at', tiebreaker_field='id')
+            page = paginator.paginate_querysets([follows], request, descending)
 
-        for item in public_data:
-            item['app_tender_type'] = 'public'
+            public_uuids = [follow.tender_uuid for follow in page if follow.tender_type == 'public']
+            private_uuids = [follow.tender_uuid for follow in page if follow.tender_type == 'private']
+            found = {tender.uuid: tender for tender in public_tenders.filter(uuid__in=public_uuids)}
+            found.update({tender.uuid: tender for tender in private_tenders.filter(uuid__in=private_uuids)})
+            tenders = [found[follow.tender_uuid] for follow in page if follow.tender_uuid in found]
 
-        for item in private_data:
-            item['app_tender_type'] = 'private'
+        data = []
+        for tender in tenders:
+            if isinstance(tender, PublicTender):
+                item = PublicTenderListSerializer(tender).data
+                item['app_tender_type'] = 'public'
+            else:
+                item = PrivateTenderSerializer(tender).data
+                item['app_tender_type'] = 'private'
+            data.append(item)
 
-        return Response(public_data + private_data)
+        return paginator.get_paginated_response(data)
 
 
-class PrivateTenderViewSet(viewsets.ModelViewSet):
+class PrivateTenderViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = PrivateTenderSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description', 'company_name', 'shared_with__username']
     ordering_fields = ['publication_date', 'submission_deadline', 'created_at']
@@ -91,13 +192,56 @@ class PrivateTenderViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        return PrivateTender.objects.filter(
-            Q(owner=user) | Q(shared_with=user)
-        ).distinct()
+        return PrivateTender.objects.visible_to(user)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        validators = queryset_validators(request, [(self.filter_queryset(self.get_queryset()), 'updated_at')])
+        return self.conditional_response(
+            request,
+            validators,
+            lambda: super(PrivateTenderViewSet, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        instance = self.get_object()
+        return self.conditional_response(
+            request,
+            instance_validators(request, instance),
+            lambda: Response(self.get_serializer(instance).data)
+        )
 
     def perform_create(self, serializer: PrivateTenderSerializer) -> None:
         serializer.save(owner=self.request.user)
 
+    @extend_schema(request=PrivateTenderSharingSerializer)
+    @action(detail=True, methods=['patch'], url_path='sharing')
+    def sharing(self, request: Request, uuid: Optional[str] = None) -> Response:
+        instance = self.get_object()
+        if instance.owner_id != request.user.pk:
+            raise PermissionDenied("Tylko właściciel może zmieniać udostępnianie przetargu.")
+
+        serializer = PrivateTenderSharingSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        add_usernames = set(serializer.validated_data['add'])
+        remove_usernames = set(serializer.validated_data['remove'])
+
+        users = dict(
+            get_user_model().objects.filter(
+                username__in=add_usernames | remove_usernames
+            ).values_list('username', 'id')
+        )
+        added, removed = instance.change_shared_with(
+            add=[users[username] for username in add_usernames if username in users],
+            remove=[users[username] for username in remove_usernames if username in users]
+        )
+        usernames = {user_id: username for username, user_id in users.items()}
+
+        return Response({
+            'added': sorted(usernames[user_id] for user_id in added),
+            'removed': sorted(usernames[user_id] for user_id in removed),
+            'unknown': sorted((add_usernames | remove_usernames) - set(users)),
+        })
+
 
 class TenderNoteViewSet(mixins.CreateModelMixin, mixins.DestroyModelMixin, GenericViewSet):
     serializer_class = TenderNoteSerializer
@@ -134,6 +278,51 @@ class TenderNoteViewSet(mixins.CreateModelMixin, mixins.DestroyModelMixin, Gener
         serializer = self.get_serializer(notes, many=True)
         return Response(serializer.data)
 
+    @extend_schema(request=BulkTenderNoteSerializer)
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request: Request) -> Response:
+        serializer = BulkTenderNoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data['notes']
+
+        statuses = get_tender_resolver(request).check_access_many(
+            (item['tender_uuid'], item['tender_type']) for item in items
+        )
+
+        results = []
+        notes = []
+        for item in items:
+            item_status = statuses[(item['tender_uuid'], item['tender_type'])]
+            if item_status == ACCESS_GRANTED:
+                item_status = 'created'
+                notes.append(TenderNote(user=request.user, **item))
+            results.append({
+                'tender_uuid': item['tender_uuid'],
+                'tender_type': item['tender_type'],
+                'status': item_status,
+            })
+
+        TenderNote.objects.bulk_create(notes)
+
+        return Response({'created': len(notes), 'results': results}, status=status.HTTP_200_OK)
+
+    @extend_schema(request=BulkTenderNoteDeleteSerializer)
+    @action(detail=False, methods=['post'], url_path='bulk-delete')
+    def bulk_delete(self, request: Request) -> Response:
+        serializer = BulkTenderNoteDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(serializer.validated_data['ids']))
+
+        notes = self.get_queryset().filter(id__in=ids)
+        existing = set(notes.values_list('id', flat=True))
+        notes.delete()
+
+        results = [
+            {'id': note_id, 'status': 'deleted' if note_id in existing else 'not_found'}
+            for note_id in ids
+        ]
+        return Response({'deleted': len(existing), 'results': results}, status=status.HTTP_200_OK)
+
 
 class FollowTenderViewSet(viewsets.ModelViewSet):
     serializer_class = FollowTenderSerializer
@@ -148,3 +337,104 @@ class FollowTenderViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer: TenderNoteSerializer) -> None:
         serializer.save(user=self.request.user)
+
+    @extend_schema(request=BulkTenderReferenceSerializer)
+    @action(detail=False, methods=['post', 'delete'], url_path='bulk')
+    def bulk(self, request: Request) -> Response:
+        serializer = BulkTenderReferenceSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        references = list(dict.fromkeys(
+            (item['tender_uuid'], item['tender_type']) for item in serializer.validated_data['tenders']
+        ))
+
+        if request.method == 'DELETE':
+            return self.bulk_unfollow(request, references)
+        return self.bulk_follow(request, references)
+
+    def bulk_follow(self, request: Request, references: List[Any]) -> Response:
+        user = request.user
+        statuses = get_tender_resolver(request).check_access_many(references)
+        already_followed = set(
+            FollowTender.objects.filter(
+                user=user,
+                tender_uuid__in=[tender_uuid for tender_uuid, _ in references]
+            ).values_list('tender_uuid', flat=True)
+        )
+
+        results = []
+        follows = []
+        for tender_uuid, tender_type in references:
+            item_status = statuses[(tender_uuid, tender_type)]
+            if item_status == ACCESS_GRANTED:
+                if tender_uuid in already_followed:
+                    item_status = 'exists'
+                else:
+                    item_status = 'created'
+                    already_followed.add(tender_uuid)
+                    follows.append(FollowTender(user=user, tender_uuid=tender_uuid, tender_type=tender_type))
+            results.append({'tender_uuid': tender_uuid, 'tender_type': tender_type, 'status': item_status})
+
+        FollowTender.objects.bulk_create(follows, ignore_conflicts=True)
+
+        return Response({'created': len(follows), 'results': results}, status=status.HTTP_200_OK)
+
+    def bulk_unfollow(self, request: Request, references: List[Any]) -> Response:
+        pairs = Q()
+        for tender_uuid, tender_type in references:
+            pairs |= Q(tender_uuid=tender_uuid, tender_type=tender_type)
+        follows = self.get_queryset().filter(pairs)
+        followed = set(follows.values_list('tender_uuid', 'tender_type'))
+        follows.delete()
+
+        results = [
+            {
+                'tender_uuid': tender_uuid,
+                'tender_type': tender_type,
+                'status': 'deleted' if (tender_uuid, tender_type) in followed else 'not_found',
+            }
+            for tender_uuid, tender_type in references
+        ]
+        return Response({'deleted': len(followed), 'results': results}, status=status.HTTP_200_OK)
+
+
+class TenderStatsViewSet(PublicResponseCacheMixin, mixins.ListModelMixin, GenericViewSet):
+    serializer_class = TenderDailyStatSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        query = TenderStatsQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        stats = TenderDailyStat.objects.filter(dimension=params['dimension'])
+        if 'date_from' in params:
+            stats = stats.filter(day__gte=params['date_from'])
+        if 'date_to' in params:
+            stats = stats.filter(day__lte=params['date_to'])
+        if 'value' in params:
+            stats = stats.filter(value=params['value'])
+        return stats.order_by('-day', '-count', 'value')
+
+    @extend_schema(parameters=[TenderStatsQuerySerializer])
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return self.cached_public_response(
+            request,
+            lambda: super(TenderStatsViewSet, self).list(request, *args, **kwargs)
+        )
+
+    @extend_schema(parameters=[UpcomingDeadlinesQuerySerializer])
+    @action(detail=False, methods=['get'])
+    def upcoming(self, request: Request) -> Response:
+        query = UpcomingDeadlinesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        today = timezone.localdate()
+
+        def render() -> Response:
+            stats = TenderDailyStat.objects.filter(
+                dimension=TenderDailyStat.DIMENSION_DEADLINE,
+                day__gte=today,
+                day__lt=today + timedelta(days=query.validated_data['days'])
+            ).order_by('day')
+            return Response(TenderDailyStatSerializer(stats, many=True).data)
+
+        return self.cached_public_response(request, render, extra_key=today.isoformat())